@@ -1,42 +1,71 @@
 from __future__ import annotations
 
-import sqlite3
 import sys
+from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QApplication
+if TYPE_CHECKING:
+    import sqlite3
 
-from data.database import get_connection, init_database, seed_demo_data
-from data.repositories import AccountRepository, BudgetRepository, GoalRepository, TransactionRepository
-from services.finance_service import FinanceService
-from ui.main_window import MainWindow
-from ui.styles import apply_dark_theme
+    from services.finance_service import FinanceService
 
 
 def build_service() -> tuple[FinanceService, sqlite3.Connection]:
+    # Imported here rather than at module top so `import app` stays cheap;
+    # PySide6 and the data layer only load once the app actually starts.
+    from data.database import get_connection, get_read_connection, init_database, seed_demo_data
+    from data.repositories import AccountRepository, BudgetRepository, GoalRepository, TransactionRepository
+    from services.finance_service import FinanceService
+
     connection = get_connection()
-    init_database(connection)
-    seed_demo_data(connection)
+    if init_database(connection):
+        seed_demo_data(connection)
+    read_connection = get_read_connection()
 
     service = FinanceService(
-        account_repo=AccountRepository(connection),
-        transaction_repo=TransactionRepository(connection),
-        budget_repo=BudgetRepository(connection),
-        goal_repo=GoalRepository(connection),
+        account_repo=AccountRepository(connection, read_connection),
+        transaction_repo=TransactionRepository(connection, read_connection),
+        budget_repo=BudgetRepository(connection, read_connection),
+        goal_repo=GoalRepository(connection, read_connection),
     )
     return service, connection
 
 
 def main() -> int:
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from data.database import close_connection
+    from ui.main_window import MainWindow
+    from ui.styles import apply_dark_theme
+
     app = QApplication(sys.argv)
     apply_dark_theme(app)
 
-    service, connection = build_service()
-    window = MainWindow(service)
+    # Show the window before touching the database so the first frame does
+    # not wait on file I/O, schema DDL, or demo seeding. The service is
+    # attached on the next event-loop turn; sqlite3 connections are bound to
+    # their creating thread, so the deferred init stays on the GUI thread.
+    window = MainWindow(service=None)
     window.show()
 
-    exit_code = app.exec()
-    connection.close()
-    return exit_code
+    connection_holder: list[sqlite3.Connection] = []
+
+    def initialize_database() -> None:
+        service, connection = build_service()
+        connection_holder.append(connection)
+        connection_holder.append(service.read_connection)
+        window.set_service(service)
+
+    def shutdown() -> None:
+        if connection_holder:
+            # Close the read-only handle first; PRAGMA optimize only makes
+            # sense on the writer.
+            connection_holder[1].close()
+            close_connection(connection_holder[0])
+
+    app.aboutToQuit.connect(shutdown)
+    QTimer.singleShot(0, initialize_database)
+    return app.exec()
 
 
 if __name__ == "__main__":
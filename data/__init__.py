@@ -1,12 +1,37 @@
-from .database import get_connection, init_database, seed_demo_data
-from .repositories import AccountRepository, BudgetRepository, GoalRepository, TransactionRepository
+from __future__ import annotations
+
+from typing import Any
+
+# PEP 562 lazy re-exports: neither submodule is imported until one of its
+# names is first accessed, which keeps `import data` off the startup path.
+_DATABASE_EXPORTS = frozenset(
+    {"close_connection", "get_connection", "get_read_connection", "init_database", "seed_demo_data"}
+)
+_REPOSITORY_EXPORTS = frozenset(
+    {"AccountRepository", "TransactionRepository", "BudgetRepository", "GoalRepository", "UnitOfWork"}
+)
 
 __all__ = [
+    "close_connection",
     "get_connection",
+    "get_read_connection",
     "init_database",
     "seed_demo_data",
     "AccountRepository",
     "TransactionRepository",
     "BudgetRepository",
     "GoalRepository",
+    "UnitOfWork",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _DATABASE_EXPORTS:
+        from data import database
+
+        return getattr(database, name)
+    if name in _REPOSITORY_EXPORTS:
+        from data import repositories
+
+        return getattr(repositories, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 import sqlite3
 import sys
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
 
+from data.repositories import UnitOfWork, _to_cents
+
 
 APP_DATA_DIR_NAME = "PersonalFinanceDashboard"
 DATA_DIR_ENV_VAR = "FINANCEAPP_DATA_DIR"
 LEGACY_DB_PATH = Path(__file__).resolve().parent.parent / "finance.db"
 
 
+@functools.lru_cache(maxsize=1)
 def resolve_data_dir() -> Path:
     configured = os.getenv(DATA_DIR_ENV_VAR)
     if configured:
@@ -35,32 +40,131 @@ DB_PATH = DATA_DIR / "finance.db"
 
 
 def _migrate_legacy_database() -> None:
-    if DB_PATH.exists():
-        return
-    if not LEGACY_DB_PATH.exists():
+    if LEGACY_DB_PATH == DB_PATH or DB_PATH.exists():
         return
-    if LEGACY_DB_PATH == DB_PATH:
-        return
-    shutil.copy2(LEGACY_DB_PATH, DB_PATH)
+    try:
+        shutil.copy2(LEGACY_DB_PATH, DB_PATH)
+    except FileNotFoundError:
+        pass
 
 
-def get_connection() -> sqlite3.Connection:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _migrate_legacy_database()
-    connection = sqlite3.connect(DB_PATH)
-    connection.row_factory = sqlite3.Row
+# Runs once at import; resolve_data_dir() already created the data directory,
+# so get_connection() does not need to stat the filesystem per open.
+_migrate_legacy_database()
+
+
+def _tune_connection(connection: sqlite3.Connection) -> None:
     connection.execute("PRAGMA foreign_keys = ON;")
+    # WAL persists in the database file; only switch when not already active
+    # to avoid rewriting the header on every open.
+    journal_mode = connection.execute("PRAGMA journal_mode;").fetchone()[0]
+    if str(journal_mode).lower() != "wal":
+        connection.execute("PRAGMA journal_mode = WAL;")
+    connection.execute("PRAGMA synchronous = NORMAL;")
+    connection.execute("PRAGMA temp_store = MEMORY;")
+    connection.execute("PRAGMA cache_size = -64000;")
+    connection.execute("PRAGMA mmap_size = 268435456;")
+    connection.execute("PRAGMA busy_timeout = 5000;")
+
+
+def close_connection(connection: sqlite3.Connection) -> None:
+    connection.execute("PRAGMA optimize;")
+    connection.close()
+
+
+def get_connection() -> sqlite3.Connection:
+    # Rows come back as plain tuples; repository queries keep their column
+    # order aligned with the dataclass field order and unpack positionally,
+    # which avoids sqlite3.Row's per-access name lookup.
+    connection = sqlite3.connect(DB_PATH, cached_statements=256)
+    _tune_connection(connection)
+    return connection
+
+
+def get_read_connection() -> sqlite3.Connection:
+    """Open a second, read-only handle onto the same database.
+
+    Under WAL a reader never blocks the writer, but a shared connection still
+    serialises reporting queries behind any open UnitOfWork batch. Routing
+    reads through a ``mode=ro`` handle keeps them off that queue, and the
+    read-only open makes an accidental write on the reporting path fail fast.
+    """
+    connection = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, cached_statements=256)
+    # Same read-side tuning as the writer; journal_mode is persistent in the
+    # file and cannot be switched from a read-only handle anyway.
+    connection.execute("PRAGMA temp_store = MEMORY;")
+    connection.execute("PRAGMA cache_size = -64000;")
+    connection.execute("PRAGMA mmap_size = 268435456;")
+    connection.execute("PRAGMA busy_timeout = 5000;")
     return connection
 
 
-def init_database(connection: sqlite3.Connection) -> None:
+# Bumped whenever the DDL below changes shape. Stored in PRAGMA user_version
+# so warm starts can skip parsing the schema script entirely:
+#   0  original layout (REAL money columns, no FTS) or a brand-new file
+#   1  transitional: stamped by the short-lived "seeded" sentinel
+#   2  FTS5 search table + covering indexes
+#   3  integer-cents money columns
+#   4  monthly_category_agg roll-up table + maintenance triggers
+#   5  single-column category/account indexes for the dropdown queries
+# Anything below the current value is upgraded by the idempotent DDL plus
+# _migrate_money_to_cents, which key off the objects actually present.
+_SCHEMA_VERSION = 5
+
+
+# Money used to be stored as REAL dollars; integer cents make aggregation
+# exact and remove the ROUND() workarounds on the dedupe path.
+_CENTS_MIGRATIONS = (
+    ("accounts", (("balance", "balance_cents"),)),
+    ("transactions", (("amount", "amount_cents"),)),
+    ("budgets", (("planned", "planned_cents"),)),
+    ("goals", (("target", "target_cents"), ("current", "current_cents"))),
+)
+
+
+def _migrate_money_to_cents(connection: sqlite3.Connection) -> None:
+    for table, columns in _CENTS_MIGRATIONS:
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        if not existing:
+            continue  # fresh database, table not created yet
+        for old, new in columns:
+            if old not in existing:
+                continue
+            # Indexes that cover the old column block DROP COLUMN.
+            if table == "transactions":
+                connection.execute("DROP INDEX IF EXISTS idx_tx_dedupe")
+                connection.execute("DROP INDEX IF EXISTS idx_tx_type_cat_amount")
+            connection.execute(f'ALTER TABLE {table} ADD COLUMN {new} INTEGER NOT NULL DEFAULT 0')
+            connection.execute(f'UPDATE {table} SET {new} = CAST(ROUND({old} * 100) AS INTEGER)')
+            connection.execute(f'ALTER TABLE {table} DROP COLUMN "{old}"')
+    connection.commit()
+
+
+def init_database(connection: sqlite3.Connection) -> bool:
+    """Create or upgrade the schema; returns True for a freshly created file.
+
+    When PRAGMA user_version already matches _SCHEMA_VERSION the whole DDL
+    script is skipped, so warm starts pay for a single pragma read instead
+    of re-parsing every CREATE ... IF NOT EXISTS statement.
+    """
+    (version,) = connection.execute("PRAGMA user_version;").fetchone()
+    if version == _SCHEMA_VERSION:
+        return False
+
+    fresh = not connection.execute(
+        "SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'transactions')"
+    ).fetchone()[0]
+    _migrate_money_to_cents(connection)
+    has_fts = connection.execute(
+        "SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE name = 'transactions_fts')"
+    ).fetchone()[0]
     connection.executescript(
         """
         CREATE TABLE IF NOT EXISTS accounts(
             id INTEGER PRIMARY KEY,
             name TEXT NOT NULL UNIQUE,
             kind TEXT NOT NULL,
-            balance REAL NOT NULL DEFAULT 0
+            balance_cents INTEGER NOT NULL DEFAULT 0
         );
 
         CREATE TABLE IF NOT EXISTS transactions(
@@ -69,7 +173,7 @@ def init_database(connection: sqlite3.Connection) -> None:
             description TEXT NOT NULL,
             category TEXT NOT NULL,
             account TEXT NOT NULL,
-            amount REAL NOT NULL,
+            amount_cents INTEGER NOT NULL,
             type TEXT NOT NULL CHECK(type IN ('income', 'expense'))
         );
 
@@ -77,24 +181,122 @@ def init_database(connection: sqlite3.Connection) -> None:
             id INTEGER PRIMARY KEY,
             month TEXT NOT NULL,
             category TEXT NOT NULL,
-            planned REAL NOT NULL,
+            planned_cents INTEGER NOT NULL,
             UNIQUE(month, category)
         );
 
         CREATE TABLE IF NOT EXISTS goals(
             id INTEGER PRIMARY KEY,
             name TEXT NOT NULL,
-            target REAL NOT NULL,
-            current REAL NOT NULL,
+            target_cents INTEGER NOT NULL,
+            current_cents INTEGER NOT NULL,
             deadline TEXT
         );
 
         CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
-        CREATE INDEX IF NOT EXISTS idx_transactions_month ON transactions(substr(date, 1, 7));
-        CREATE INDEX IF NOT EXISTS idx_transactions_search ON transactions(description, category, account);
+        DROP INDEX IF EXISTS idx_transactions_month;
+        CREATE INDEX IF NOT EXISTS idx_tx_dedupe ON transactions(date, description, account, amount_cents);
+        DROP INDEX IF EXISTS idx_transactions_search;
+        CREATE INDEX IF NOT EXISTS idx_tx_date_id ON transactions(date DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS idx_tx_type_cat_amount ON transactions(type, category, amount_cents);
+        CREATE INDEX IF NOT EXISTS idx_tx_category ON transactions(category);
+        CREATE INDEX IF NOT EXISTS idx_tx_account ON transactions(account);
+
+        CREATE TABLE IF NOT EXISTS monthly_category_agg(
+            month TEXT NOT NULL,
+            category TEXT NOT NULL,
+            income_cents INTEGER NOT NULL DEFAULT 0,
+            expense_cents INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY(month, category)
+        ) WITHOUT ROWID;
+
+        CREATE TRIGGER IF NOT EXISTS transactions_agg_ai AFTER INSERT ON transactions BEGIN
+            INSERT INTO monthly_category_agg(month, category, income_cents, expense_cents)
+            VALUES (
+                substr(new.date, 1, 7), new.category,
+                CASE WHEN new.type = 'income' THEN new.amount_cents ELSE 0 END,
+                CASE WHEN new.type = 'expense' THEN abs(new.amount_cents) ELSE 0 END
+            )
+            ON CONFLICT(month, category) DO UPDATE SET
+                income_cents = income_cents + excluded.income_cents,
+                expense_cents = expense_cents + excluded.expense_cents;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS transactions_agg_ad AFTER DELETE ON transactions BEGIN
+            UPDATE monthly_category_agg SET
+                income_cents = income_cents - CASE WHEN old.type = 'income' THEN old.amount_cents ELSE 0 END,
+                expense_cents = expense_cents - CASE WHEN old.type = 'expense' THEN abs(old.amount_cents) ELSE 0 END
+            WHERE month = substr(old.date, 1, 7) AND category = old.category;
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS transactions_agg_au AFTER UPDATE ON transactions BEGIN
+            UPDATE monthly_category_agg SET
+                income_cents = income_cents - CASE WHEN old.type = 'income' THEN old.amount_cents ELSE 0 END,
+                expense_cents = expense_cents - CASE WHEN old.type = 'expense' THEN abs(old.amount_cents) ELSE 0 END
+            WHERE month = substr(old.date, 1, 7) AND category = old.category;
+            INSERT INTO monthly_category_agg(month, category, income_cents, expense_cents)
+            VALUES (
+                substr(new.date, 1, 7), new.category,
+                CASE WHEN new.type = 'income' THEN new.amount_cents ELSE 0 END,
+                CASE WHEN new.type = 'expense' THEN abs(new.amount_cents) ELSE 0 END
+            )
+            ON CONFLICT(month, category) DO UPDATE SET
+                income_cents = income_cents + excluded.income_cents,
+                expense_cents = expense_cents + excluded.expense_cents;
+        END;
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5(
+            description, category, account,
+            content='transactions', content_rowid='id'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS transactions_ai AFTER INSERT ON transactions BEGIN
+            INSERT INTO transactions_fts(rowid, description, category, account)
+            VALUES (new.id, new.description, new.category, new.account);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS transactions_ad AFTER DELETE ON transactions BEGIN
+            INSERT INTO transactions_fts(transactions_fts, rowid, description, category, account)
+            VALUES ('delete', old.id, old.description, old.category, old.account);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS transactions_au AFTER UPDATE ON transactions BEGIN
+            INSERT INTO transactions_fts(transactions_fts, rowid, description, category, account)
+            VALUES ('delete', old.id, old.description, old.category, old.account);
+            INSERT INTO transactions_fts(rowid, description, category, account)
+            VALUES (new.id, new.description, new.category, new.account);
+        END;
         """
     )
+    if not has_fts:
+        # Index any rows that predate the FTS table (existing databases).
+        connection.execute("INSERT INTO transactions_fts(transactions_fts) VALUES('rebuild')")
+    # Any rows inserted before the triggers existed are not in the roll-up
+    # yet; a rebuild on the upgrade path brings it in line (no-op when fresh).
+    rebuild_month_aggregates(connection)
+    connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION};")
     connection.commit()
+    return fresh
+
+
+def rebuild_month_aggregates(connection: sqlite3.Connection) -> None:
+    """Recompute monthly_category_agg from scratch off the transactions table.
+
+    The triggers keep the roll-up incremental during normal operation; this
+    full rebuild covers bulk paths that bypass them conceptually (schema
+    upgrades, database restores).
+    """
+    connection.execute("DELETE FROM monthly_category_agg")
+    connection.execute(
+        """
+        INSERT INTO monthly_category_agg(month, category, income_cents, expense_cents)
+        SELECT substr(date, 1, 7), category,
+               SUM(CASE WHEN type = 'income' THEN amount_cents ELSE 0 END),
+               SUM(CASE WHEN type = 'expense' THEN abs(amount_cents) ELSE 0 END)
+        FROM transactions
+        GROUP BY 1, 2
+        """
+    )
 
 
 def _shift_month(base: date, delta: int) -> date:
@@ -104,82 +306,107 @@ def _shift_month(base: date, delta: int) -> date:
     return date(year, month, 1)
 
 
+_SEED_ACCOUNTS = (
+    ("Checking", "Asset", 5300.00),
+    ("Savings", "Asset", 15000.00),
+    ("Brokerage", "Asset", 9200.00),
+    ("Credit Card", "Debt", 2200.00),
+)
+
+# (day, description, category, account, amount, type) for the previous and
+# current month respectively; dates are attached while streaming.
+_SEED_PREVIOUS_MONTH = (
+    (1, "Salary", "Income", "Checking", 4200.0, "income"),
+    (3, "Freelance Project", "Income", "Checking", 600.0, "income"),
+    (4, "Monthly Rent", "Housing", "Checking", -1450.0, "expense"),
+    (6, "Supermarket", "Groceries", "Checking", -320.0, "expense"),
+    (9, "Electric + Internet", "Utilities", "Checking", -180.0, "expense"),
+    (11, "Dinner with Friends", "Dining", "Checking", -140.0, "expense"),
+    (14, "Gas", "Transport", "Checking", -90.0, "expense"),
+    (17, "Gym Membership", "Health", "Checking", -55.0, "expense"),
+    (21, "Streaming + Games", "Entertainment", "Checking", -120.0, "expense"),
+    (24, "Index ETF Buy", "Investments", "Brokerage", -500.0, "expense"),
+)
+_SEED_CURRENT_MONTH = (
+    (1, "Salary", "Income", "Checking", 4200.0, "income"),
+    (2, "Quarterly Bonus", "Income", "Checking", 300.0, "income"),
+    (4, "Monthly Rent", "Housing", "Checking", -1450.0, "expense"),
+    (5, "Supermarket", "Groceries", "Checking", -340.0, "expense"),
+    (7, "Electric + Internet", "Utilities", "Checking", -170.0, "expense"),
+    (10, "Coffee + Lunch", "Dining", "Checking", -155.0, "expense"),
+    (13, "Fuel + Parking", "Transport", "Checking", -95.0, "expense"),
+    (16, "Subscriptions", "Entertainment", "Checking", -42.0, "expense"),
+    (19, "Pharmacy", "Health", "Checking", -110.0, "expense"),
+    (23, "Weekend Trip", "Travel", "Checking", -260.0, "expense"),
+)
+
+# (category, planned for current month, planned for previous month)
+_SEED_BUDGETS = (
+    ("Housing", 1500.0, 1500.0),
+    ("Groceries", 450.0, 420.0),
+    ("Utilities", 250.0, 240.0),
+    ("Dining", 220.0, 210.0),
+    ("Transport", 180.0, 170.0),
+    ("Entertainment", 160.0, 150.0),
+)
+
+
+def _seed_transaction_rows(previous: date, current: date) -> Iterator[tuple[str, str, str, str, int, str]]:
+    for base, spec in ((previous, _SEED_PREVIOUS_MONTH), (current, _SEED_CURRENT_MONTH)):
+        for day, description, category, account, amount, tx_type in spec:
+            yield (base.replace(day=day).isoformat(), description, category, account, _to_cents(amount), tx_type)
+
+
+def _seed_budget_rows(previous: date, current: date) -> Iterator[tuple[str, str, int]]:
+    previous_key = previous.strftime("%Y-%m")
+    current_key = current.strftime("%Y-%m")
+    for category, current_planned, previous_planned in _SEED_BUDGETS:
+        yield (current_key, category, _to_cents(current_planned))
+        yield (previous_key, category, _to_cents(previous_planned))
+
+
 def seed_demo_data(connection: sqlite3.Connection) -> None:
-    tx_count = connection.execute("SELECT COUNT(*) AS count FROM transactions").fetchone()["count"]
-    goal_count = connection.execute("SELECT COUNT(*) AS count FROM goals").fetchone()["count"]
-    if tx_count:
+    # Normally only called right after init_database creates a fresh file;
+    # the probes keep a direct call on a populated database harmless.
+    has_transactions, has_goals = connection.execute(
+        "SELECT EXISTS(SELECT 1 FROM transactions), EXISTS(SELECT 1 FROM goals)"
+    ).fetchone()
+    if has_transactions:
         return
 
-    connection.executemany(
-        "INSERT OR IGNORE INTO accounts(name, kind, balance) VALUES(?, ?, ?)",
-        [
-            ("Checking", "Asset", 5300.00),
-            ("Savings", "Asset", 15000.00),
-            ("Brokerage", "Asset", 9200.00),
-            ("Credit Card", "Debt", 2200.00),
-        ],
-    )
-
     now = date.today()
     current = _shift_month(now, 0)
     previous = _shift_month(now, -1)
+    goal_deadline = f"{now.year + 1}-12-31"
 
-    seed_transactions = [
-        (previous.replace(day=1).isoformat(), "Salary", "Income", "Checking", 4200.0, "income"),
-        (previous.replace(day=3).isoformat(), "Freelance Project", "Income", "Checking", 600.0, "income"),
-        (previous.replace(day=4).isoformat(), "Monthly Rent", "Housing", "Checking", -1450.0, "expense"),
-        (previous.replace(day=6).isoformat(), "Supermarket", "Groceries", "Checking", -320.0, "expense"),
-        (previous.replace(day=9).isoformat(), "Electric + Internet", "Utilities", "Checking", -180.0, "expense"),
-        (previous.replace(day=11).isoformat(), "Dinner with Friends", "Dining", "Checking", -140.0, "expense"),
-        (previous.replace(day=14).isoformat(), "Gas", "Transport", "Checking", -90.0, "expense"),
-        (previous.replace(day=17).isoformat(), "Gym Membership", "Health", "Checking", -55.0, "expense"),
-        (previous.replace(day=21).isoformat(), "Streaming + Games", "Entertainment", "Checking", -120.0, "expense"),
-        (previous.replace(day=24).isoformat(), "Index ETF Buy", "Investments", "Brokerage", -500.0, "expense"),
-        (current.replace(day=1).isoformat(), "Salary", "Income", "Checking", 4200.0, "income"),
-        (current.replace(day=2).isoformat(), "Quarterly Bonus", "Income", "Checking", 300.0, "income"),
-        (current.replace(day=4).isoformat(), "Monthly Rent", "Housing", "Checking", -1450.0, "expense"),
-        (current.replace(day=5).isoformat(), "Supermarket", "Groceries", "Checking", -340.0, "expense"),
-        (current.replace(day=7).isoformat(), "Electric + Internet", "Utilities", "Checking", -170.0, "expense"),
-        (current.replace(day=10).isoformat(), "Coffee + Lunch", "Dining", "Checking", -155.0, "expense"),
-        (current.replace(day=13).isoformat(), "Fuel + Parking", "Transport", "Checking", -95.0, "expense"),
-        (current.replace(day=16).isoformat(), "Subscriptions", "Entertainment", "Checking", -42.0, "expense"),
-        (current.replace(day=19).isoformat(), "Pharmacy", "Health", "Checking", -110.0, "expense"),
-        (current.replace(day=23).isoformat(), "Weekend Trip", "Travel", "Checking", -260.0, "expense"),
-    ]
-
-    connection.executemany(
-        """
-        INSERT INTO transactions(date, description, category, account, amount, type)
-        VALUES(?, ?, ?, ?, ?, ?)
-        """,
-        seed_transactions,
-    )
-
-    connection.executemany(
-        "INSERT OR IGNORE INTO budgets(month, category, planned) VALUES(?, ?, ?)",
-        [
-            (current.strftime("%Y-%m"), "Housing", 1500.0),
-            (current.strftime("%Y-%m"), "Groceries", 450.0),
-            (current.strftime("%Y-%m"), "Utilities", 250.0),
-            (current.strftime("%Y-%m"), "Dining", 220.0),
-            (current.strftime("%Y-%m"), "Transport", 180.0),
-            (current.strftime("%Y-%m"), "Entertainment", 160.0),
-            (previous.strftime("%Y-%m"), "Housing", 1500.0),
-            (previous.strftime("%Y-%m"), "Groceries", 420.0),
-            (previous.strftime("%Y-%m"), "Utilities", 240.0),
-            (previous.strftime("%Y-%m"), "Dining", 210.0),
-            (previous.strftime("%Y-%m"), "Transport", 170.0),
-            (previous.strftime("%Y-%m"), "Entertainment", 150.0),
-        ],
-    )
+    with UnitOfWork(connection):
+        connection.executemany(
+            "INSERT OR IGNORE INTO accounts(name, kind, balance_cents) VALUES(?, ?, ?)",
+            ((name, kind, _to_cents(balance)) for name, kind, balance in _SEED_ACCOUNTS),
+        )
 
-    if not goal_count:
-        connection.execute(
+        connection.executemany(
             """
-            INSERT INTO goals(name, target, current, deadline)
-            VALUES(?, ?, ?, ?)
+            INSERT INTO transactions(date, description, category, account, amount_cents, type)
+            VALUES(?, ?, ?, ?, ?, ?)
             """,
-            ("Emergency Fund", 20000.0, 15000.0, f"{now.year + 1}-12-31"),
+            _seed_transaction_rows(previous, current),
         )
 
-    connection.commit()
+        connection.executemany(
+            "INSERT OR IGNORE INTO budgets(month, category, planned_cents) VALUES(?, ?, ?)",
+            _seed_budget_rows(previous, current),
+        )
+
+        if not has_goals:
+            connection.execute(
+                """
+                INSERT INTO goals(name, target_cents, current_cents, deadline)
+                VALUES(?, ?, ?, ?)
+                """,
+                ("Emergency Fund", _to_cents(20000.0), _to_cents(15000.0), goal_deadline),
+            )
+
+    # Give the planner fresh statistics now that the tables have content.
+    connection.execute("ANALYZE;")
+
@@ -1,65 +1,233 @@
 from __future__ import annotations
 
 import sqlite3
-from models import Account, Budget, Goal, Transaction
+from collections.abc import Iterable
+from itertools import starmap
+from operator import itemgetter
+
+from models import Account, Budget, Goal, MonthSummary, Transaction
+
+
+# First-column extractor for the list-of-strings queries; map(itemgetter(0),
+# cursor) skips the per-row comprehension frame work.
+_first_column = itemgetter(0)
+
+
+# Connections currently enrolled in an open UnitOfWork; entries are removed
+# again when the outermost unit exits.
+_ACTIVE_UNITS: set[sqlite3.Connection] = set()
+
+
+# Hot transaction queries are kept as fixed module-level templates (one
+# variant per filter combination) so sqlite3's statement cache can reuse the
+# prepared statement instead of re-parsing a freshly built string per call.
+# Money columns hold integer cents; the SELECT list converts back to dollar
+# floats so the dataclasses and UI keep their existing float API.
+_TX_SELECT = "SELECT id, date, description, category, account, amount_cents / 100.0, type FROM transactions"
+# Month filters use a half-open date range instead of substr(date, 1, 7) so
+# the plain idx_transactions_date B-tree serves them as an ordered range scan.
+_TX_MONTH_PREDICATE = "date >= ? AND date < ?"
+# Search goes through the FTS5 index instead of leading-wildcard LIKEs, which
+# would force a full table scan on every keystroke.
+_TX_SEARCH_PREDICATE = "id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ?)"
+_TX_ORDER = " ORDER BY date DESC, id DESC"
+
+_TX_LIST_RECENT_SQL = {
+    (False, False): _TX_SELECT + _TX_ORDER + " LIMIT ? OFFSET ?",
+    (True, False): _TX_SELECT + " WHERE " + _TX_MONTH_PREDICATE + _TX_ORDER + " LIMIT ? OFFSET ?",
+    (False, True): _TX_SELECT + " WHERE " + _TX_SEARCH_PREDICATE + _TX_ORDER + " LIMIT ? OFFSET ?",
+    (True, True): (
+        _TX_SELECT
+        + " WHERE "
+        + _TX_MONTH_PREDICATE
+        + " AND "
+        + _TX_SEARCH_PREDICATE
+        + _TX_ORDER
+        + " LIMIT ? OFFSET ?"
+    ),
+}
+
+_TX_LIST_BY_MONTH_SQL = {
+    False: _TX_SELECT + " WHERE " + _TX_MONTH_PREDICATE + _TX_ORDER + " LIMIT ? OFFSET ?",
+    True: (
+        _TX_SELECT
+        + " WHERE "
+        + _TX_MONTH_PREDICATE
+        + " AND "
+        + _TX_SEARCH_PREDICATE
+        + _TX_ORDER
+        + " LIMIT ? OFFSET ?"
+    ),
+}
+
+# Raw rows in CSV-report column order; export feeds these tuples straight to
+# csv.writerows without building Transaction dataclasses.
+# Amounts are formatted to two decimals inside SQLite so the CSV export can
+# stream cursor tuples straight to csv.writerows without touching each row.
+_TX_EXPORT_SELECT = (
+    "SELECT date, description, category, account, type, printf('%.2f', amount_cents / 100.0) FROM transactions"
+)
+_TX_EXPORT_SQL = {
+    False: _TX_EXPORT_SELECT + " WHERE " + _TX_MONTH_PREDICATE + _TX_ORDER,
+    True: _TX_EXPORT_SELECT + " WHERE " + _TX_MONTH_PREDICATE + " AND " + _TX_SEARCH_PREDICATE + _TX_ORDER,
+}
+
+
+class UnitOfWork:
+    """Batch several repository writes into one transaction.
+
+    Mutating repository methods normally commit as soon as they run. Inside a
+    ``with UnitOfWork(connection):`` block those intermediate commits are
+    skipped and everything is flushed in a single COMMIT on exit (or rolled
+    back if the block raises). Nesting is allowed; only the outermost unit
+    owns the transaction.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self._owns_transaction = False
+
+    def __enter__(self) -> UnitOfWork:
+        if self.connection not in _ACTIVE_UNITS:
+            self.connection.execute("BEGIN IMMEDIATE")
+            _ACTIVE_UNITS.add(self.connection)
+            self._owns_transaction = True
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._owns_transaction:
+            return
+        _ACTIVE_UNITS.discard(self.connection)
+        if exc_type is None:
+            _maybe_commit(self.connection)
+        else:
+            self.connection.rollback()
+
+
+def _maybe_commit(connection: sqlite3.Connection) -> None:
+    if connection not in _ACTIVE_UNITS:
+        connection.commit()
+
+
+def _month_bounds(month: str) -> tuple[str, str]:
+    """Half-open ISO date range [first of month, first of next month)."""
+    year = int(month[:4])
+    mon = int(month[5:7])
+    if mon == 12:
+        year, mon = year + 1, 1
+    else:
+        mon += 1
+    return f"{month}-01", f"{year:04d}-{mon:02d}-01"
+
+
+def _fts_query(token: str) -> str:
+    """Quote a raw search token as an FTS5 prefix query."""
+    escaped = token.replace('"', '""')
+    return f'"{escaped}"*'
+
+
+def _to_cents(amount: float) -> int:
+    """Convert a dollar amount to the integer-cents storage representation."""
+    return round(amount * 100)
 
 
 class AccountRepository:
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        read_connection: sqlite3.Connection | None = None,
+    ) -> None:
         self.connection = connection
+        self.read_connection = read_connection or connection
 
     def list_all(self) -> list[Account]:
-        rows = self.connection.execute(
-            "SELECT id, name, kind, balance FROM accounts ORDER BY kind, name"
+        rows = self.read_connection.execute(
+            "SELECT id, name, kind, balance_cents / 100.0 FROM accounts ORDER BY kind, name"
         ).fetchall()
-        return [Account(id=row["id"], name=row["name"], kind=row["kind"], balance=row["balance"]) for row in rows]
+        return list(starmap(Account, rows))
 
     def list_names(self) -> list[str]:
-        rows = self.connection.execute("SELECT name FROM accounts ORDER BY name").fetchall()
-        return [row["name"] for row in rows]
+        cursor = self.read_connection.execute("SELECT name FROM accounts ORDER BY name")
+        return list(map(_first_column, cursor))
 
-    def get_by_name(self, name: str) -> Account | None:
-        row = self.connection.execute(
-            "SELECT id, name, kind, balance FROM accounts WHERE name = ?",
-            (name,),
-        ).fetchone()
-        if not row:
-            return None
-        return Account(id=row["id"], name=row["name"], kind=row["kind"], balance=row["balance"])
+    def adjust_balance(self, name: str, delta: float, kind: str = "Asset") -> None:
+        self.connection.execute(
+            """
+            INSERT INTO accounts(name, kind, balance_cents) VALUES(?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET balance_cents = balance_cents + excluded.balance_cents
+            """,
+            (name, kind, _to_cents(delta)),
+        )
+        _maybe_commit(self.connection)
 
-    def ensure_account(self, name: str, kind: str = "Asset") -> Account:
-        existing = self.get_by_name(name)
-        if existing:
-            return existing
+    def adjust_balance_many(self, deltas: Iterable[tuple[str, float]], kind: str = "Asset") -> None:
+        """Apply many (name, delta) balance adjustments on one prepared UPSERT.
 
-        cursor = self.connection.execute(
-            "INSERT INTO accounts(name, kind, balance) VALUES(?, ?, 0)",
-            (name, kind),
+        executemany binds every row against a single statement, so a bulk
+        import settles all account balances without per-account execute
+        round trips.
+        """
+        self.connection.executemany(
+            """
+            INSERT INTO accounts(name, kind, balance_cents) VALUES(?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET balance_cents = balance_cents + excluded.balance_cents
+            """,
+            ((name, kind, _to_cents(delta)) for name, delta in deltas),
         )
-        self.connection.commit()
-        return Account(id=cursor.lastrowid, name=name, kind=kind, balance=0.0)
+        _maybe_commit(self.connection)
 
-    def adjust_balance(self, name: str, delta: float, kind: str = "Asset") -> None:
-        self.ensure_account(name, kind=kind)
-        self.connection.execute(
-            "UPDATE accounts SET balance = balance + ? WHERE name = ?",
-            (delta, name),
-        )
-        self.connection.commit()
+    def sum_assets_debts(self) -> tuple[float, float]:
+        """(assets, debts) totals split by kind in one aggregate query."""
+        assets_cents, debts_cents = self.read_connection.execute(
+            """
+            SELECT
+                COALESCE(SUM(CASE WHEN lower(trim(kind)) IN ('debt', 'liability')
+                                  THEN 0 ELSE balance_cents END), 0),
+                COALESCE(SUM(CASE WHEN lower(trim(kind)) IN ('debt', 'liability')
+                                  THEN abs(balance_cents) ELSE 0 END), 0)
+            FROM accounts
+            """
+        ).fetchone()
+        return assets_cents / 100.0, debts_cents / 100.0
 
     def count(self) -> int:
-        row = self.connection.execute("SELECT COUNT(*) AS count FROM accounts").fetchone()
-        return int(row["count"])
+        (count,) = self.read_connection.execute("SELECT COUNT(*) FROM accounts").fetchone()
+        return int(count)
 
 
 class TransactionRepository:
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        read_connection: sqlite3.Connection | None = None,
+    ) -> None:
         self.connection = connection
+        self.read_connection = read_connection or connection
+        self._mutation_seq = 0
+        self._distinct_cache: dict[str, tuple[int, list[str]]] = {}
+        self._summary_cache: dict[str, tuple[int, MonthSummary]] = {}
+
+    @property
+    def mutation_seq(self) -> int:
+        """Monotonic counter bumped on every write; usable as a cache key."""
+        return self._mutation_seq
+
+    def invalidate_cache(self) -> None:
+        """Signal an out-of-band change (e.g. a database restore)."""
+        self._mutation_seq += 1
+
+    def _cached_distinct(self, key: str, sql: str) -> list[str]:
+        cached = self._distinct_cache.get(key)
+        if cached is not None and cached[0] == self._mutation_seq:
+            return cached[1]
+        values = list(map(_first_column, self.read_connection.execute(sql)))
+        self._distinct_cache[key] = (self._mutation_seq, values)
+        return values
 
     def add(self, transaction: Transaction) -> int:
         cursor = self.connection.execute(
             """
-            INSERT INTO transactions(date, description, category, account, amount, type)
+            INSERT INTO transactions(date, description, category, account, amount_cents, type)
             VALUES(?, ?, ?, ?, ?, ?)
             """,
             (
@@ -67,18 +235,85 @@ class TransactionRepository:
                 transaction.description,
                 transaction.category,
                 transaction.account,
-                transaction.amount,
+                _to_cents(transaction.amount),
                 transaction.type,
             ),
         )
-        self.connection.commit()
+        _maybe_commit(self.connection)
+        self._mutation_seq += 1
         return int(cursor.lastrowid)
 
+    def import_rows(self, rows: Iterable[tuple[str, str, str, str, float, str]]) -> tuple[int, list[tuple[str, float]]]:
+        """Bulk-import rows, deduplicating with an in-SQL anti-join.
+
+        The candidate (date, description, category, account, amount, type)
+        tuples land in a temp staging table via one executemany; duplicate
+        keys within the batch and rows already present in transactions are
+        then discarded with set-based DELETEs before a single INSERT ... 
+        SELECT moves the survivors over. Returns the inserted count plus the
+        per-account balance deltas of the rows that actually made it, both
+        computed inside SQLite. Callers wrap this in a UnitOfWork so the
+        whole batch shares one COMMIT.
+        """
+        self.connection.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS import_stage(
+                date TEXT, description TEXT, category TEXT,
+                account TEXT, amount_cents INTEGER, type TEXT
+            )
+            """
+        )
+        self.connection.execute("DELETE FROM import_stage")
+        self.connection.executemany(
+            "INSERT INTO import_stage VALUES(?, ?, ?, ?, ?, ?)",
+            (
+                (date, description, category, account, _to_cents(amount), tx_type)
+                for date, description, category, account, amount, tx_type in rows
+            ),
+        )
+        # In-batch duplicates: keep the first occurrence of each dedupe key.
+        self.connection.execute(
+            """
+            DELETE FROM import_stage WHERE rowid NOT IN (
+                SELECT MIN(rowid) FROM import_stage
+                GROUP BY date, description, account, amount_cents
+            )
+            """
+        )
+        # Anti-join against rows already imported earlier.
+        self.connection.execute(
+            """
+            DELETE FROM import_stage WHERE EXISTS (
+                SELECT 1 FROM transactions t
+                WHERE t.date = import_stage.date
+                  AND t.description = import_stage.description
+                  AND t.account = import_stage.account
+                  AND t.amount_cents = import_stage.amount_cents
+            )
+            """
+        )
+        cursor = self.connection.execute(
+            """
+            INSERT INTO transactions(date, description, category, account, amount_cents, type)
+            SELECT date, description, category, account, amount_cents, type FROM import_stage
+            """
+        )
+        deltas = [
+            (account, delta_cents / 100.0)
+            for account, delta_cents in self.connection.execute(
+                "SELECT account, SUM(amount_cents) FROM import_stage GROUP BY account"
+            )
+        ]
+        self.connection.execute("DELETE FROM import_stage")
+        _maybe_commit(self.connection)
+        self._mutation_seq += 1
+        return cursor.rowcount, deltas
+
     def update(self, transaction_id: int, transaction: Transaction) -> None:
         self.connection.execute(
             """
             UPDATE transactions
-            SET date = ?, description = ?, category = ?, account = ?, amount = ?, type = ?
+            SET date = ?, description = ?, category = ?, account = ?, amount_cents = ?, type = ?
             WHERE id = ?
             """,
             (
@@ -86,21 +321,23 @@ class TransactionRepository:
                 transaction.description,
                 transaction.category,
                 transaction.account,
-                transaction.amount,
+                _to_cents(transaction.amount),
                 transaction.type,
                 transaction_id,
             ),
         )
-        self.connection.commit()
+        _maybe_commit(self.connection)
+        self._mutation_seq += 1
 
     def delete(self, transaction_id: int) -> None:
         self.connection.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
-        self.connection.commit()
+        _maybe_commit(self.connection)
+        self._mutation_seq += 1
 
     def get_by_id(self, transaction_id: int) -> Transaction | None:
-        row = self.connection.execute(
+        row = self.read_connection.execute(
             """
-            SELECT id, date, description, category, account, amount, type
+            SELECT id, date, description, category, account, amount_cents / 100.0, type
             FROM transactions
             WHERE id = ?
             """,
@@ -108,237 +345,234 @@ class TransactionRepository:
         ).fetchone()
         if not row:
             return None
-        return Transaction(
-            id=row["id"],
-            date=row["date"],
-            description=row["description"],
-            category=row["category"],
-            account=row["account"],
-            amount=row["amount"],
-            type=row["type"],
-        )
-
-    def list_recent(self, limit: int = 15, month: str | None = None, search: str = "") -> list[Transaction]:
-        conditions = []
+        return Transaction(*row)
+
+    def list_recent(
+        self,
+        limit: int = 15,
+        month: str | None = None,
+        search: str = "",
+        offset: int = 0,
+    ) -> list[Transaction]:
         params: list[object] = []
 
         if month:
-            conditions.append("substr(date, 1, 7) = ?")
-            params.append(month)
+            params.extend(_month_bounds(month))
 
-        if search.strip():
-            conditions.append("(description LIKE ? OR category LIKE ? OR account LIKE ?)")
-            token = f"%{search.strip()}%"
-            params.extend([token, token, token])
+        token = search.strip()
+        if token:
+            params.append(_fts_query(token))
 
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        params.append(limit)
+        params.extend((limit, offset))
 
-        rows = self.connection.execute(
-            f"""
-            SELECT id, date, description, category, account, amount, type
-            FROM transactions
-            {where_clause}
-            ORDER BY date DESC, id DESC
-            LIMIT ?
-            """,
+        rows = self.read_connection.execute(
+            _TX_LIST_RECENT_SQL[(bool(month), bool(token))],
             tuple(params),
         ).fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return list(starmap(Transaction, rows))
 
-    def list_by_month(self, month: str, search: str = "") -> list[Transaction]:
-        params: list[object] = [month]
-        where_clause = "WHERE substr(date, 1, 7) = ?"
+    def list_by_month(self, month: str, search: str = "", limit: int = -1, offset: int = 0) -> list[Transaction]:
+        # limit=-1 is SQLite's "no limit", so callers that want the full
+        # month keep getting it without a second statement variant.
+        params: list[object] = [*_month_bounds(month)]
 
-        if search.strip():
-            token = f"%{search.strip()}%"
-            where_clause += " AND (description LIKE ? OR category LIKE ? OR account LIKE ?)"
-            params.extend([token, token, token])
+        token = search.strip()
+        if token:
+            params.append(_fts_query(token))
 
-        rows = self.connection.execute(
-            f"""
-            SELECT id, date, description, category, account, amount, type
-            FROM transactions
-            {where_clause}
-            ORDER BY date DESC, id DESC
-            """,
+        params.extend((limit, offset))
+
+        rows = self.read_connection.execute(
+            _TX_LIST_BY_MONTH_SQL[bool(token)],
             tuple(params),
         ).fetchall()
-        return [self._row_to_transaction(row) for row in rows]
+        return list(starmap(Transaction, rows))
 
-    def count(self) -> int:
-        row = self.connection.execute("SELECT COUNT(*) AS count FROM transactions").fetchone()
-        return int(row["count"])
+    def list_by_month_rows(self, month: str, search: str = "") -> sqlite3.Cursor:
+        """Raw (date, description, category, account, type, amount) tuples.
 
-    def distinct_months(self) -> list[str]:
-        rows = self.connection.execute(
-            "SELECT DISTINCT substr(date, 1, 7) AS month FROM transactions ORDER BY month DESC"
-        ).fetchall()
-        return [row["month"] for row in rows if row["month"]]
+        Returns the cursor itself so callers can stream rows into
+        csv.writer.writerows without materializing a list of dataclasses.
+        """
+        params: list[object] = [*_month_bounds(month)]
+
+        token = search.strip()
+        if token:
+            params.append(_fts_query(token))
+
+        return self.read_connection.execute(_TX_EXPORT_SQL[bool(token)], tuple(params))
+
+    def count(self) -> int:
+        (count,) = self.read_connection.execute("SELECT COUNT(*) FROM transactions").fetchone()
+        return int(count)
 
     def distinct_categories(self) -> list[str]:
-        rows = self.connection.execute(
-            "SELECT DISTINCT category FROM transactions ORDER BY category"
-        ).fetchall()
-        return [row["category"] for row in rows if row["category"]]
+        return self._cached_distinct(
+            "categories",
+            "SELECT DISTINCT category FROM transactions WHERE category != '' ORDER BY category",
+        )
 
     def distinct_accounts(self) -> list[str]:
-        rows = self.connection.execute("SELECT DISTINCT account FROM transactions ORDER BY account").fetchall()
-        return [row["account"] for row in rows if row["account"]]
+        return self._cached_distinct(
+            "accounts",
+            "SELECT DISTINCT account FROM transactions WHERE account != '' ORDER BY account",
+        )
 
-    def monthly_income_expense(self, month: str) -> tuple[float, float]:
-        row = self.connection.execute(
-            """
-            SELECT
-                COALESCE(SUM(CASE WHEN type = 'income' THEN amount ELSE 0 END), 0) AS income,
-                COALESCE(SUM(CASE WHEN type = 'expense' THEN ABS(amount) ELSE 0 END), 0) AS expense
-            FROM transactions
-            WHERE substr(date, 1, 7) = ?
-            """,
+    def month_summary(self, month: str) -> MonthSummary:
+        """Income, expense, net, and per-category spend for one month.
+
+        Reads the monthly_category_agg roll-up that the transaction triggers
+        maintain, so the cost is O(#categories) regardless of how many
+        transactions the month holds. Both the dashboard metrics and the
+        expense breakdown ask for the same month during one refresh; the
+        mutation-seq cache hands the second caller the first result.
+        """
+        cached = self._summary_cache.get(month)
+        if cached is not None and cached[0] == self._mutation_seq:
+            return cached[1]
+        rows = self.read_connection.execute(
+            "SELECT category, income_cents, expense_cents FROM monthly_category_agg WHERE month = ?",
             (month,),
-        ).fetchone()
-        return float(row["income"]), float(row["expense"])
+        ).fetchall()
 
-    def monthly_net(self, month: str) -> float:
-        row = self.connection.execute(
-            """
-            SELECT COALESCE(SUM(amount), 0) AS net
-            FROM transactions
-            WHERE substr(date, 1, 7) = ?
-            """,
-            (month,),
-        ).fetchone()
-        return float(row["net"])
+        income = 0
+        expense = 0
+        expense_by_category: list[tuple[str, float]] = []
+        for category, income_cents, expense_cents in rows:
+            income += income_cents
+            expense += expense_cents
+            if expense_cents:
+                expense_by_category.append((category, expense_cents / 100.0))
+
+        expense_by_category.sort(key=lambda item: item[1], reverse=True)
+        summary = MonthSummary(
+            income=income / 100.0,
+            expense=expense / 100.0,
+            net=(income - expense) / 100.0,
+            expense_by_category=expense_by_category,
+        )
+        self._summary_cache[month] = (self._mutation_seq, summary)
+        return summary
 
-    def expense_by_category(self, month: str) -> list[tuple[str, float]]:
-        rows = self.connection.execute(
+    def income_expense_by_month(self, start_month: str, end_month: str) -> dict[str, tuple[float, float]]:
+        """(income, expense) per month across [start_month, end_month].
+
+        One grouped read of the monthly_category_agg roll-up replaces the
+        per-month month_summary loop the cashflow chart used to run.
+        """
+        rows = self.read_connection.execute(
             """
-            SELECT category, ABS(SUM(amount)) AS spent
-            FROM transactions
-            WHERE substr(date, 1, 7) = ?
-              AND type = 'expense'
-            GROUP BY category
-            ORDER BY spent DESC
+            SELECT month, SUM(income_cents), SUM(expense_cents)
+            FROM monthly_category_agg
+            WHERE month >= ? AND month <= ?
+            GROUP BY month
             """,
-            (month,),
-        ).fetchall()
-        return [(row["category"], float(row["spent"])) for row in rows]
-
-    def dedupe_keys(self) -> set[tuple[str, str, float, str]]:
-        rows = self.connection.execute(
-            "SELECT date, description, amount, account FROM transactions"
-        ).fetchall()
-        return {(row["date"], row["description"], round(float(row["amount"]), 2), row["account"]) for row in rows}
-
-    @staticmethod
-    def _row_to_transaction(row: sqlite3.Row) -> Transaction:
-        return Transaction(
-            id=row["id"],
-            date=row["date"],
-            description=row["description"],
-            category=row["category"],
-            account=row["account"],
-            amount=float(row["amount"]),
-            type=row["type"],
+            (start_month, end_month),
         )
+        return {month: (income / 100.0, expense / 100.0) for month, income, expense in rows}
 
 
 class BudgetRepository:
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        read_connection: sqlite3.Connection | None = None,
+    ) -> None:
         self.connection = connection
+        self.read_connection = read_connection or connection
 
     def upsert(self, month: str, category: str, planned: float) -> None:
         self.connection.execute(
             """
-            INSERT INTO budgets(month, category, planned)
+            INSERT INTO budgets(month, category, planned_cents)
             VALUES(?, ?, ?)
-            ON CONFLICT(month, category) DO UPDATE SET planned = excluded.planned
+            ON CONFLICT(month, category) DO UPDATE SET planned_cents = excluded.planned_cents
             """,
-            (month, category, planned),
+            (month, category, _to_cents(planned)),
         )
-        self.connection.commit()
+        _maybe_commit(self.connection)
 
     def list_by_month(self, month: str) -> list[Budget]:
-        rows = self.connection.execute(
+        rows = self.read_connection.execute(
             """
-            SELECT id, month, category, planned
+            SELECT id, month, category, planned_cents / 100.0
             FROM budgets
             WHERE month = ?
             ORDER BY category
             """,
             (month,),
         ).fetchall()
-        return [Budget(id=row["id"], month=row["month"], category=row["category"], planned=row["planned"]) for row in rows]
+        return list(starmap(Budget, rows))
 
-    def distinct_months(self) -> list[str]:
-        rows = self.connection.execute("SELECT DISTINCT month FROM budgets ORDER BY month DESC").fetchall()
-        return [row["month"] for row in rows if row["month"]]
+    def planned_total(self, month: str) -> float:
+        (total,) = self.read_connection.execute(
+            "SELECT COALESCE(SUM(planned_cents), 0) / 100.0 FROM budgets WHERE month = ?",
+            (month,),
+        ).fetchone()
+        return float(total)
 
     def count(self) -> int:
-        row = self.connection.execute("SELECT COUNT(*) AS count FROM budgets").fetchone()
-        return int(row["count"])
+        (count,) = self.read_connection.execute("SELECT COUNT(*) FROM budgets").fetchone()
+        return int(count)
 
 
 class GoalRepository:
-    def __init__(self, connection: sqlite3.Connection) -> None:
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        read_connection: sqlite3.Connection | None = None,
+    ) -> None:
         self.connection = connection
+        self.read_connection = read_connection or connection
 
     def add(self, goal: Goal) -> int:
         cursor = self.connection.execute(
             """
-            INSERT INTO goals(name, target, current, deadline)
+            INSERT INTO goals(name, target_cents, current_cents, deadline)
             VALUES(?, ?, ?, ?)
             """,
-            (goal.name, goal.target, goal.current, goal.deadline),
+            (goal.name, _to_cents(goal.target), _to_cents(goal.current), goal.deadline),
         )
-        self.connection.commit()
+        _maybe_commit(self.connection)
         return int(cursor.lastrowid)
 
     def update(self, goal_id: int, goal: Goal) -> None:
         self.connection.execute(
             """
             UPDATE goals
-            SET name = ?, target = ?, current = ?, deadline = ?
+            SET name = ?, target_cents = ?, current_cents = ?, deadline = ?
             WHERE id = ?
             """,
-            (goal.name, goal.target, goal.current, goal.deadline, goal_id),
+            (goal.name, _to_cents(goal.target), _to_cents(goal.current), goal.deadline, goal_id),
         )
-        self.connection.commit()
+        _maybe_commit(self.connection)
 
     def delete(self, goal_id: int) -> None:
         self.connection.execute("DELETE FROM goals WHERE id = ?", (goal_id,))
-        self.connection.commit()
+        _maybe_commit(self.connection)
 
     def get_by_id(self, goal_id: int) -> Goal | None:
-        row = self.connection.execute(
-            "SELECT id, name, target, current, deadline FROM goals WHERE id = ?",
+        row = self.read_connection.execute(
+            "SELECT id, name, target_cents / 100.0, current_cents / 100.0, deadline FROM goals WHERE id = ?",
             (goal_id,),
         ).fetchone()
         if not row:
             return None
-        return Goal(
-            id=row["id"],
-            name=row["name"],
-            target=float(row["target"]),
-            current=float(row["current"]),
-            deadline=row["deadline"],
-        )
+        return Goal(*row)
 
     def list_all(self) -> list[Goal]:
-        rows = self.connection.execute(
-            "SELECT id, name, target, current, deadline FROM goals ORDER BY id DESC"
+        rows = self.read_connection.execute(
+            "SELECT id, name, target_cents / 100.0, current_cents / 100.0, deadline FROM goals ORDER BY id DESC"
         ).fetchall()
-        return [
-            Goal(
-                id=row["id"],
-                name=row["name"],
-                target=float(row["target"]),
-                current=float(row["current"]),
-                deadline=row["deadline"],
-            )
-            for row in rows
-        ]
+        return list(starmap(Goal, rows))
+
+    def totals(self) -> tuple[float, float]:
+        """(total target, total current) across all goals, summed in SQL."""
+        target_cents, current_cents = self.read_connection.execute(
+            "SELECT COALESCE(SUM(target_cents), 0), COALESCE(SUM(current_cents), 0) FROM goals"
+        ).fetchone()
+        return target_cents / 100.0, current_cents / 100.0
 
     def count(self) -> int:
-        row = self.connection.execute("SELECT COUNT(*) AS count FROM goals").fetchone()
-        return int(row["count"])
+        (count,) = self.read_connection.execute("SELECT COUNT(*) FROM goals").fetchone()
+        return int(count)
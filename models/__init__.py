@@ -1,3 +1,3 @@
-from .entities import Account, Budget, Goal, Transaction
+from .entities import Account, Budget, Goal, MonthSummary, Transaction
 
-__all__ = ["Account", "Transaction", "Budget", "Goal"]
+__all__ = ["Account", "Transaction", "Budget", "Goal", "MonthSummary"]
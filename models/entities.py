@@ -30,6 +30,14 @@ class Budget:
     planned: float
 
 
+@dataclass(slots=True)
+class MonthSummary:
+    income: float
+    expense: float
+    net: float
+    expense_by_category: list[tuple[str, float]]
+
+
 @dataclass(slots=True)
 class Goal:
     id: int | None
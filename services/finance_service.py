@@ -1,14 +1,50 @@
 from __future__ import annotations
 
 import csv
+import functools
 import sqlite3
+from collections.abc import Callable
 from datetime import date, datetime
 from pathlib import Path
 
-from data.database import DB_PATH, init_database
-from data.repositories import AccountRepository, BudgetRepository, GoalRepository, TransactionRepository
+from data.database import DB_PATH, get_connection, get_read_connection, init_database
+from data.repositories import (
+    AccountRepository,
+    BudgetRepository,
+    GoalRepository,
+    TransactionRepository,
+    UnitOfWork,
+)
 from models import Goal, Transaction
 
+# Currency formatter for CSV export: two decimals beats csv.writer falling
+# back to str(), which emits full float repr and costs more per cell.
+_fmt = "{:.2f}".format
+
+
+def _memoized(method):
+    """Cache a read method's result until the service's data generation moves.
+
+    Keys combine the method name with its arguments, so repeated refreshes
+    for the same (month, search) pair — tab switches, redundant repaints —
+    skip the queries entirely. Every write path bumps the generation, which
+    invalidates all entries at once.
+    """
+
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        entry = self._result_cache.get(key)
+        if entry is not None and entry[0] == self._cache_gen:
+            return entry[1]
+        value = method(self, *args, **kwargs)
+        self._result_cache[key] = (self._cache_gen, value)
+        return value
+
+    return wrapper
+
 
 class FinanceService:
     def __init__(
@@ -23,33 +59,45 @@ class FinanceService:
         self.budget_repo = budget_repo
         self.goal_repo = goal_repo
         self.connection = account_repo.connection
+        self.read_connection = account_repo.read_connection
+        self._cache_gen = 0
+        self._result_cache: dict[tuple, tuple[int, object]] = {}
+
+    def _invalidate_result_cache(self) -> None:
+        self._cache_gen += 1
+        self._result_cache.clear()
 
     def get_available_months(self) -> list[str]:
-        months = set(self.transaction_repo.distinct_months())
-        months.update(self.budget_repo.distinct_months())
-        months.update(self._last_n_months(date.today().strftime("%Y-%m"), 6))
-        months.add(date.today().strftime("%Y-%m"))
+        # One UNION round trip covers both tables; SQLite dedupes the month
+        # keys, and Python only folds in the handful of computed recents.
+        cursor = self.read_connection.execute(
+            """
+            SELECT DISTINCT m FROM (
+                SELECT substr(date, 1, 7) AS m FROM transactions WHERE date != ''
+                UNION
+                SELECT month AS m FROM budgets WHERE month != ''
+            )
+            """
+        )
+        today = date.today().strftime("%Y-%m")
+        months = {m for (m,) in cursor}
+        months.update(self._last_n_months(today, 6))
+        months.add(today)
         return sorted(months, reverse=True)
 
+    @_memoized
     def get_dashboard_metrics(self, month: str) -> dict[str, float]:
-        accounts = self.account_repo.list_all()
-        assets = 0.0
-        debts = 0.0
-
-        for account in accounts:
-            kind = account.kind.strip().lower()
-            if kind in {"debt", "liability"}:
-                debts += abs(account.balance)
-            else:
-                assets += account.balance
-
-        income, expense = self.transaction_repo.monthly_income_expense(month)
-        cashflow = income - expense
+        assets, debts = self.account_repo.sum_assets_debts()
+        summary = self.transaction_repo.month_summary(month)
+        income, expense = summary.income, summary.expense
+        cashflow = summary.net
         savings_rate = (cashflow / income) if income > 0 else 0.0
 
-        budget_rows = self.get_budget_rows(month)
-        planned_total = sum(row["planned"] for row in budget_rows)
-        actual_total = sum(row["actual"] for row in budget_rows)
+        # The budgets "actual" is the month's expense total, which the
+        # summary above already carries; planned comes from one SUM in SQL.
+        # No need to materialize the per-category budget rows here.
+        planned_total = self.budget_repo.planned_total(month)
+        actual_total = expense
         budget_pct = (actual_total / planned_total) if planned_total > 0 else 0.0
 
         return {
@@ -64,11 +112,13 @@ class FinanceService:
             "budget_pct": budget_pct,
         }
 
+    @_memoized
     def get_cashflow_over_time(self, selected_month: str, months: int = 6) -> list[dict[str, float | str]]:
         period = self._last_n_months(selected_month, months)
+        by_month = self.transaction_repo.income_expense_by_month(period[0], period[-1])
         result: list[dict[str, float | str]] = []
         for month in period:
-            income, expense = self.transaction_repo.monthly_income_expense(month)
+            income, expense = by_month.get(month, (0.0, 0.0))
             result.append(
                 {
                     "month": month,
@@ -79,27 +129,29 @@ class FinanceService:
             )
         return result
 
+    @_memoized
     def get_expense_breakdown(self, month: str) -> list[dict[str, float | str]]:
-        rows = self.transaction_repo.expense_by_category(month)
+        rows = self.transaction_repo.month_summary(month).expense_by_category
         return [{"category": category, "spent": spent} for category, spent in rows]
 
+    @_memoized
     def get_networth_over_time(self, selected_month: str, months: int = 6) -> list[dict[str, float | str]]:
         cashflow = self.get_cashflow_over_time(selected_month, months)
         current_networth = self.get_dashboard_metrics(selected_month)["net_worth"]
-        baseline = current_networth - sum(float(row["net"]) for row in cashflow)
+        baseline = current_networth - sum(row["net"] for row in cashflow)
 
         points: list[dict[str, float | str]] = []
         rolling = baseline
         for row in cashflow:
-            rolling += float(row["net"])
+            rolling += row["net"]
             points.append({"month": row["month"], "value": rolling})
         return points
 
-    def get_recent_transactions(self, month: str, search: str = "", limit: int = 15):
-        return self.transaction_repo.list_recent(limit=limit, month=month, search=search)
+    def get_recent_transactions(self, month: str, search: str = "", limit: int = 15, offset: int = 0):
+        return self.transaction_repo.list_recent(limit=limit, month=month, search=search, offset=offset)
 
-    def get_transactions(self, month: str, search: str = ""):
-        return self.transaction_repo.list_by_month(month=month, search=search)
+    def get_transactions(self, month: str, search: str = "", limit: int = -1, offset: int = 0):
+        return self.transaction_repo.list_by_month(month=month, search=search, limit=limit, offset=offset)
 
     def get_accounts(self):
         return self.account_repo.list_all()
@@ -107,6 +159,23 @@ class FinanceService:
     def get_categories(self) -> list[str]:
         return self.transaction_repo.distinct_categories()
 
+    @_memoized
+    def get_category_union(self, month: str) -> list[str]:
+        # Transaction categories plus the month's budgeted ones, deduped and
+        # sorted inside SQLite; the covering category index feeds the first
+        # branch without touching the table.
+        cursor = self.read_connection.execute(
+            """
+            SELECT DISTINCT category FROM (
+                SELECT category FROM transactions WHERE category != ''
+                UNION
+                SELECT category FROM budgets WHERE month = ?
+            ) ORDER BY category
+            """,
+            (month,),
+        )
+        return [category for (category,) in cursor]
+
     def get_account_names(self) -> list[str]:
         names = set(self.account_repo.list_names())
         names.update(self.transaction_repo.distinct_accounts())
@@ -139,6 +208,7 @@ class FinanceService:
         )
         created_id = self.transaction_repo.add(transaction)
         self.account_repo.adjust_balance(transaction.account, transaction.amount)
+        self._invalidate_result_cache()
         return created_id
 
     def update_transaction(
@@ -177,6 +247,7 @@ class FinanceService:
         else:
             self.account_repo.adjust_balance(old.account, -old.amount)
             self.account_repo.adjust_balance(updated.account, updated.amount)
+        self._invalidate_result_cache()
 
     def delete_transaction(self, transaction_id: int) -> None:
         existing = self.transaction_repo.get_by_id(transaction_id)
@@ -184,6 +255,7 @@ class FinanceService:
             return
         self.transaction_repo.delete(transaction_id)
         self.account_repo.adjust_balance(existing.account, -existing.amount)
+        self._invalidate_result_cache()
 
     def set_budget(self, month: str, category: str, planned: float) -> None:
         if planned < 0:
@@ -191,17 +263,19 @@ class FinanceService:
         if not category.strip():
             raise ValueError("Category is required.")
         self.budget_repo.upsert(month=month, category=category.strip(), planned=planned)
+        self._invalidate_result_cache()
 
+    @_memoized
     def get_budget_rows(self, month: str) -> list[dict[str, float | str]]:
         budget_rows = self.budget_repo.list_by_month(month)
         planned = {row.category: row.planned for row in budget_rows}
-        actual = {row["category"]: float(row["spent"]) for row in self.get_expense_breakdown(month)}
+        actual = {row["category"]: row["spent"] for row in self.get_expense_breakdown(month)}
 
         categories = sorted(set(planned.keys()) | set(actual.keys()))
         rows: list[dict[str, float | str]] = []
         for category in categories:
-            planned_value = float(planned.get(category, 0.0))
-            actual_value = float(actual.get(category, 0.0))
+            planned_value = planned.get(category, 0.0)
+            actual_value = actual.get(category, 0.0)
             remaining = planned_value - actual_value
             utilization = (actual_value / planned_value) if planned_value > 0 else 0.0
             rows.append(
@@ -218,10 +292,9 @@ class FinanceService:
     def get_goals(self) -> list[Goal]:
         return self.goal_repo.list_all()
 
+    @_memoized
     def get_goals_summary(self) -> dict[str, float]:
-        goals = self.get_goals()
-        total_target = sum(goal.target for goal in goals)
-        total_current = sum(goal.current for goal in goals)
+        total_target, total_current = self.goal_repo.totals()
         progress = (total_current / total_target) if total_target > 0 else 0.0
         return {
             "total_target": total_target,
@@ -250,7 +323,9 @@ class FinanceService:
             current=float(current),
             deadline=normalized_deadline or None,
         )
-        return self.goal_repo.add(goal)
+        created_id = self.goal_repo.add(goal)
+        self._invalidate_result_cache()
+        return created_id
 
     def update_goal(self, goal_id: int, name: str, target: float, current: float, deadline: str | None) -> None:
         existing = self.goal_repo.get_by_id(goal_id)
@@ -277,9 +352,11 @@ class FinanceService:
             deadline=normalized_deadline or None,
         )
         self.goal_repo.update(goal_id, updated)
+        self._invalidate_result_cache()
 
     def delete_goal(self, goal_id: int) -> None:
         self.goal_repo.delete(goal_id)
+        self._invalidate_result_cache()
 
     def get_database_path(self) -> Path:
         return DB_PATH
@@ -296,9 +373,11 @@ class FinanceService:
         goals_summary = self.get_goals_summary()
         budget_rows = self.get_budget_rows(month)
         expense_rows = self.get_expense_breakdown(month)
-        transactions = self.get_transactions(month=month, search=search)
 
-        with target.open("w", newline="", encoding="utf-8") as handle:
+        # A wide buffer plus writerows-over-generators keeps the export one
+        # streaming pass: no per-row writerow calls, no Transaction
+        # dataclasses for the (potentially largest) transactions section.
+        with target.open("w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
             writer = csv.writer(handle)
             writer.writerow(["Personal Finance Dashboard Report"])
             writer.writerow(["Generated At", datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
@@ -307,63 +386,63 @@ class FinanceService:
             writer.writerow([])
 
             writer.writerow(["KPIs"])
-            writer.writerow(["Net Worth", metrics["net_worth"]])
-            writer.writerow(["Monthly Income", metrics["income"]])
-            writer.writerow(["Monthly Expense", metrics["expense"]])
-            writer.writerow(["Monthly Cashflow", metrics["monthly_cashflow"]])
-            writer.writerow(["Savings Rate", metrics["savings_rate"]])
-            writer.writerow(["Budget Planned", metrics["budget_planned"]])
-            writer.writerow(["Budget Spent", metrics["budget_spent"]])
-            writer.writerow(["Budget Remaining", metrics["budget_remaining"]])
+            writer.writerow(["Net Worth", _fmt(metrics["net_worth"])])
+            writer.writerow(["Monthly Income", _fmt(metrics["income"])])
+            writer.writerow(["Monthly Expense", _fmt(metrics["expense"])])
+            writer.writerow(["Monthly Cashflow", _fmt(metrics["monthly_cashflow"])])
+            writer.writerow(["Savings Rate", f"{metrics['savings_rate']:.4f}"])
+            writer.writerow(["Budget Planned", _fmt(metrics["budget_planned"])])
+            writer.writerow(["Budget Spent", _fmt(metrics["budget_spent"])])
+            writer.writerow(["Budget Remaining", _fmt(metrics["budget_remaining"])])
             writer.writerow([])
 
             writer.writerow(["Accounts"])
             writer.writerow(["Name", "Kind", "Balance"])
-            for account in accounts:
-                writer.writerow([account.name, account.kind, account.balance])
+            writer.writerows((account.name, account.kind, _fmt(account.balance)) for account in accounts)
             writer.writerow([])
 
             writer.writerow(["Budgets"])
             writer.writerow(["Category", "Planned", "Actual", "Remaining", "Utilization"])
-            for row in budget_rows:
-                writer.writerow(
-                    [
-                        row["category"],
-                        row["planned"],
-                        row["actual"],
-                        row["remaining"],
-                        row["utilization"],
-                    ]
+            writer.writerows(
+                (
+                    row["category"],
+                    _fmt(row["planned"]),
+                    _fmt(row["actual"]),
+                    _fmt(row["remaining"]),
+                    f"{row['utilization']:.4f}",
                 )
+                for row in budget_rows
+            )
             writer.writerow([])
 
             writer.writerow(["Expense Breakdown"])
             writer.writerow(["Category", "Spent"])
-            for row in expense_rows:
-                writer.writerow([row["category"], row["spent"]])
+            writer.writerows((row["category"], _fmt(row["spent"])) for row in expense_rows)
             writer.writerow([])
 
             writer.writerow(["Goals Summary"])
-            writer.writerow(["Total Current", goals_summary["total_current"]])
-            writer.writerow(["Total Target", goals_summary["total_target"]])
-            writer.writerow(["Remaining", goals_summary["remaining"]])
-            writer.writerow(["Progress", goals_summary["progress"]])
+            writer.writerow(["Total Current", _fmt(goals_summary["total_current"])])
+            writer.writerow(["Total Target", _fmt(goals_summary["total_target"])])
+            writer.writerow(["Remaining", _fmt(goals_summary["remaining"])])
+            writer.writerow(["Progress", f"{goals_summary['progress']:.4f}"])
             writer.writerow([])
 
             writer.writerow(["Goals"])
             writer.writerow(["Name", "Current", "Target", "Deadline"])
-            for goal in goals:
-                writer.writerow([goal.name, goal.current, goal.target, goal.deadline or ""])
+            writer.writerows((goal.name, _fmt(goal.current), _fmt(goal.target), goal.deadline or "") for goal in goals)
             writer.writerow([])
 
             writer.writerow(["Transactions"])
             writer.writerow(["Date", "Description", "Category", "Account", "Type", "Amount"])
-            for tx in transactions:
-                writer.writerow([tx.date, tx.description, tx.category, tx.account, tx.type, tx.amount])
+            writer.writerows(self.transaction_repo.list_by_month_rows(month, search))
 
         return target
 
-    def backup_database(self, destination: str | Path) -> Path:
+    def backup_database(
+        self,
+        destination: str | Path,
+        progress: Callable[[int, int, int], None] | None = None,
+    ) -> Path:
         target = Path(destination)
         if target.suffix.lower() != ".db":
             target = target.with_suffix(".db")
@@ -372,12 +451,20 @@ class FinanceService:
         self.connection.commit()
         backup_connection = sqlite3.connect(target)
         try:
-            self.connection.backup(backup_connection)
+            # Copy in 256-page steps instead of one monolithic pass; the
+            # source lock is released between steps, so concurrent readers
+            # proceed and the optional progress hook lets the UI layer pump
+            # its event loop during large backups.
+            self.connection.backup(backup_connection, pages=256, progress=progress)
         finally:
             backup_connection.close()
         return target
 
-    def restore_database(self, source_path: str | Path) -> None:
+    def restore_database(
+        self,
+        source_path: str | Path,
+        progress: Callable[[int, int, int], None] | None = None,
+    ) -> None:
         source = Path(source_path)
         if not source.exists():
             raise ValueError(f"Backup file does not exist: {source}")
@@ -385,9 +472,14 @@ class FinanceService:
         source_connection = sqlite3.connect(source)
         try:
             self.connection.commit()
-            source_connection.backup(self.connection)
-            self.connection.commit()
+            # backup() leaves the destination fully flushed, so no commit is
+            # needed before inspecting it. init_database gates on the file's
+            # PRAGMA user_version and is a no-op for a current-schema backup;
+            # it only runs DDL/migrations when restoring an older file.
+            source_connection.backup(self.connection, pages=256, progress=progress)
             init_database(self.connection)
+            self.transaction_repo.invalidate_cache()
+            self._invalidate_result_cache()
         finally:
             source_connection.close()
 
@@ -397,9 +489,7 @@ class FinanceService:
         if not path.exists():
             raise ValueError(f"File does not exist: {path}")
 
-        imported = 0
-        skipped = 0
-        existing = self.transaction_repo.dedupe_keys()
+        rows: list[tuple[str, str, str, str, float, str]] = []
 
         with path.open("r", encoding="utf-8-sig", newline="") as handle:
             reader = csv.DictReader(handle)
@@ -409,6 +499,8 @@ class FinanceService:
                 missing_list = ", ".join(sorted(missing))
                 raise ValueError(f"CSV missing required columns: {missing_list}")
 
+            # Parse and validate only; deduplication happens inside SQLite as
+            # an anti-join when the batch is handed to import_rows below.
             for line_number, row in enumerate(reader, start=2):
                 try:
                     date_text = (row.get("date") or "").strip()
@@ -424,34 +516,43 @@ class FinanceService:
                 if not description or not category or not account:
                     raise ValueError(f"Invalid row at line {line_number}: empty text fields are not allowed.")
 
-                key = (date_text, description, round(amount, 2), account)
-                if key in existing:
-                    skipped += 1
-                    continue
-
                 tx_type = "income" if amount >= 0 else "expense"
-                self.add_transaction(
-                    date_value=date_text,
-                    description=description,
-                    category=category,
-                    account=account,
-                    tx_type=tx_type,
-                    amount=abs(amount),
-                )
-                existing.add(key)
-                imported += 1
+                rows.append((date_text, description, category, account, amount, tx_type))
+
+        imported = 0
+        if rows:
+            with UnitOfWork(self.connection):
+                imported, balance_deltas = self.transaction_repo.import_rows(rows)
+                self.account_repo.adjust_balance_many(balance_deltas)
+            if imported:
+                self._invalidate_result_cache()
 
-        return imported, skipped
+        return imported, len(rows) - imported
 
     @staticmethod
-    def _last_n_months(end_month: str, count: int) -> list[str]:
-        end_date = datetime.strptime(f"{end_month}-01", "%Y-%m-%d").date()
-        months: list[str] = []
-        for delta in range(count - 1, -1, -1):
-            year = end_date.year
-            month = end_date.month - delta
-            while month <= 0:
-                year -= 1
-                month += 12
-            months.append(f"{year:04d}-{month:02d}")
-        return months
+    @functools.lru_cache(maxsize=64)
+    def _last_n_months(end_month: str, count: int) -> tuple[str, ...]:
+        # Pure integer month arithmetic — no datetime parsing on a path hit
+        # by every refresh. Months map onto a flat index (year * 12 + month).
+        end_index = int(end_month[:4]) * 12 + int(end_month[5:7]) - 1
+        return tuple(
+            f"{(end_index - delta) // 12:04d}-{(end_index - delta) % 12 + 1:02d}"
+            for delta in range(count - 1, -1, -1)
+        )
+
+def open_worker_service() -> FinanceService:
+    """Build a FinanceService around fresh connections for a pool thread.
+
+    sqlite3 connections are bound to the thread that created them, so
+    background workers cannot borrow the GUI thread's service. Callers own
+    the returned service's ``read_connection`` and ``connection`` and must
+    close both when done.
+    """
+    connection = get_connection()
+    read_connection = get_read_connection()
+    return FinanceService(
+        account_repo=AccountRepository(connection, read_connection),
+        transaction_repo=TransactionRepository(connection, read_connection),
+        budget_repo=BudgetRepository(connection, read_connection),
+        goal_repo=GoalRepository(connection, read_connection),
+    )
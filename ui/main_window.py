@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from datetime import date
 
-from PySide6.QtCore import QEasingCurve, QPropertyAnimation, Qt
+from PySide6.QtCore import (
+    QEasingCurve,
+    QObject,
+    QPropertyAnimation,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtWidgets import (
     QButtonGroup,
     QFileDialog,
@@ -24,12 +33,72 @@ from services import FinanceService
 from ui.pages import BudgetsPage, DashboardPage, GoalsPage, SettingsPage, TransactionsPage
 
 
+class _ReportSignals(QObject):
+    finished = Signal(str)
+    failed = Signal(str)
+
+
+class _ReportExportWorker(QRunnable):
+    """Writes the monthly report on a pool thread so the UI never blocks.
+
+    sqlite3 connections are bound to the thread that created them, so the
+    worker builds its own short-lived service around fresh connections
+    instead of borrowing the GUI thread's.
+    """
+
+    def __init__(self, month: str, destination: str, search: str) -> None:
+        super().__init__()
+        self.signals = _ReportSignals()
+        self._month = month
+        self._destination = destination
+        self._search = search
+
+    def run(self) -> None:
+        from services.finance_service import open_worker_service
+
+        try:
+            service = open_worker_service()
+            try:
+                report_path = service.export_monthly_report_csv(
+                    month=self._month,
+                    destination=self._destination,
+                    search=self._search,
+                )
+            finally:
+                service.read_connection.close()
+                service.connection.close()
+        except Exception as exc:  # surfaced via signal; the thread has no UI
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(str(report_path))
+
+
 class MainWindow(QMainWindow):
-    def __init__(self, service: FinanceService, parent=None) -> None:
+    def __init__(self, service: FinanceService | None = None, parent=None) -> None:
         super().__init__(parent)
         self.service = service
         self.nav_labels = ["Dashboard", "Transactions", "Budgets", "Goals", "Settings"]
         self._page_fade_animation: QPropertyAnimation | None = None
+        self._report_signals: _ReportSignals | None = None
+        # Pages refresh lazily: data changes mark everything dirty but only
+        # the visible page re-queries; the rest catch up when navigated to.
+        self._dirty_pages = [True] * len(self.nav_labels)
+
+        # Coalesce data-change notifications: several callbacks in one
+        # event-loop turn collapse into a single months-reload and refresh.
+        # The current page is only skipped if every caller asked to skip it.
+        self._data_changed_timer = QTimer(self)
+        self._data_changed_timer.setSingleShot(True)
+        self._data_changed_timer.setInterval(0)
+        self._data_changed_timer.timeout.connect(self._flush_data_changed)
+        self._pending_skip_current = True
+
+        # Debounce for the search box: every page re-queries on refresh, so
+        # only the last keystroke in a 200 ms window should trigger one.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self._refresh_pages)
         self.setWindowTitle("Personal Finance Dashboard")
         self.resize(1400, 900)
 
@@ -56,26 +125,52 @@ class MainWindow(QMainWindow):
         self.stacked = QStackedWidget()
         content_layout.addWidget(self.stacked, 1)
 
+        # Only the dashboard is built up front; the other pages are created
+        # on first visit so startup cost (and memory) stays "dashboard only"
+        # for sessions that never leave it. The factories read self.service
+        # at call time, so pages built after set_service get the real one.
         self.dashboard_page = DashboardPage(self.service)
-        self.transactions_page = TransactionsPage(self.service, on_data_changed=self._handle_data_changed)
-        self.budgets_page = BudgetsPage(self.service, on_data_changed=self._handle_data_changed)
-        self.goals_page = GoalsPage(self.service, on_data_changed=self._handle_data_changed)
-        self.settings_page = SettingsPage(self.service, on_data_changed=self._handle_data_changed)
-
         self.stacked.addWidget(self.dashboard_page)
-        self.stacked.addWidget(self.transactions_page)
-        self.stacked.addWidget(self.budgets_page)
-        self.stacked.addWidget(self.goals_page)
-        self.stacked.addWidget(self.settings_page)
+        self._page_factories = {
+            1: lambda: TransactionsPage(self.service, on_data_changed=self._handle_data_changed),
+            2: lambda: BudgetsPage(self.service, on_data_changed=self._handle_data_changed),
+            3: lambda: GoalsPage(self.service, on_data_changed=self._handle_data_changed),
+            4: lambda: SettingsPage(self.service, on_data_changed=self._handle_data_changed),
+        }
+        for _ in self._page_factories:
+            self.stacked.addWidget(QWidget())
 
         first_button = self.nav_group.button(0)
         if first_button:
             first_button.setChecked(True)
 
-        self._reload_months()
         self._on_nav_changed(0)
+        if self.service is not None:
+            # Let the first frame paint before any SQLite queries run.
+            QTimer.singleShot(0, self._initial_refresh)
+
+    def set_service(self, service: FinanceService) -> None:
+        """Attach the service once the deferred database setup has finished."""
+        self.service = service
+        for index in range(self.stacked.count()):
+            if index not in self._page_factories:
+                self.stacked.widget(index).service = service
+        self._initial_refresh()
+
+    def _initial_refresh(self) -> None:
+        self._reload_months()
         self._refresh_pages()
 
+    def _ensure_page(self, index: int) -> QWidget:
+        """Build the page for ``index`` on first use, replacing its placeholder."""
+        factory = self._page_factories.pop(index, None)
+        if factory is not None:
+            placeholder = self.stacked.widget(index)
+            self.stacked.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.stacked.insertWidget(index, factory())
+        return self.stacked.widget(index)
+
     def _build_sidebar(self) -> QFrame:
         frame = QFrame()
         frame.setObjectName("Sidebar")
@@ -126,7 +221,9 @@ class MainWindow(QMainWindow):
         search_label.setObjectName("MutedLabel")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Filter transactions...")
-        self.search_input.textChanged.connect(self._refresh_pages)
+        # Restart the debounce timer per keystroke; month switches stay wired
+        # directly since they are rare and should feel immediate.
+        self.search_input.textChanged.connect(self._search_timer.start)
 
         self.report_button = QPushButton("Export Report")
         self.report_button.setObjectName("ToolbarButton")
@@ -145,8 +242,10 @@ class MainWindow(QMainWindow):
         return frame
 
     def _on_nav_changed(self, page_index: int) -> None:
+        self._ensure_page(page_index)
         self.stacked.setCurrentIndex(page_index)
         self.page_title.setText(self.nav_labels[page_index])
+        self._refresh_current_page()
         self._animate_current_page()
 
     def _animate_current_page(self) -> None:
@@ -158,8 +257,14 @@ class MainWindow(QMainWindow):
             self._page_fade_animation.stop()
             self._page_fade_animation = None
 
-        effect = QGraphicsOpacityEffect(current_widget)
-        current_widget.setGraphicsEffect(effect)
+        # The effect is installed once per page and kept at opacity 1.0
+        # between animations; re-creating it every switch churned a
+        # QGraphicsOpacityEffect (and a full effect repaint) per click.
+        effect = current_widget.graphicsEffect()
+        if effect is None:
+            effect = QGraphicsOpacityEffect(current_widget)
+            effect.setOpacity(1.0)
+            current_widget.setGraphicsEffect(effect)
 
         animation = QPropertyAnimation(effect, b"opacity", self)
         animation.setDuration(220)
@@ -167,15 +272,12 @@ class MainWindow(QMainWindow):
         animation.setEndValue(1.0)
         animation.setEasingCurve(QEasingCurve.OutCubic)
 
-        def clear_effect() -> None:
-            current_widget.setGraphicsEffect(None)
-            effect.deleteLater()
-
-        animation.finished.connect(clear_effect)
         self._page_fade_animation = animation
         animation.start()
 
     def _reload_months(self, preferred_month: str | None = None) -> None:
+        if self.service is None:
+            return
         available = self.service.get_available_months()
         if not available:
             available = [date.today().strftime("%Y-%m")]
@@ -192,20 +294,49 @@ class MainWindow(QMainWindow):
         self.month_combo.blockSignals(False)
 
     def _refresh_pages(self) -> None:
+        self._dirty_pages = [True] * len(self.nav_labels)
+        self._refresh_current_page()
+
+    def _refresh_current_page(self) -> None:
+        if self.service is None:
+            return
+        index = self.stacked.currentIndex()
+        if index < 0 or not self._dirty_pages[index]:
+            return
         month = self.month_combo.currentText()
         if not month:
             return
         search = self.search_input.text().strip()
-        self.dashboard_page.refresh(month=month, search=search)
-        self.transactions_page.refresh(month=month, search=search)
-        self.budgets_page.refresh(month=month, _search=search)
-        self.goals_page.refresh(_month=month, _search=search)
-        self.settings_page.refresh()
+        page = self._ensure_page(index)
+
+        if index in (0, 1):
+            page.refresh(month=month, search=search)
+        elif index == 2:
+            page.refresh(month=month, _search=search)
+        elif index == 3:
+            page.refresh(_month=month, _search=search)
+        else:
+            page.refresh()
+        self._dirty_pages[index] = False
 
-    def _handle_data_changed(self) -> None:
+    def _handle_data_changed(self, skip_current: bool = False) -> None:
+        self._pending_skip_current = self._pending_skip_current and skip_current
+        self._data_changed_timer.start()
+
+    def _flush_data_changed(self) -> None:
+        skip_current = self._pending_skip_current
+        self._pending_skip_current = True
         current = self.month_combo.currentText()
         self._reload_months(preferred_month=current)
-        self._refresh_pages()
+        self._dirty_pages = [True] * len(self.nav_labels)
+        if skip_current:
+            # The page that made the edit already patched its own model
+            # in place; only the other pages need a re-query on next visit.
+            index = self.stacked.currentIndex()
+            if index >= 0:
+                self._dirty_pages[index] = False
+            return
+        self._refresh_current_page()
 
     def _import_csv(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(self, "Import Transactions CSV", "", "CSV Files (*.csv)")
@@ -236,14 +367,19 @@ class MainWindow(QMainWindow):
         if not file_path:
             return
 
-        try:
-            report_path = self.service.export_monthly_report_csv(
-                month=month,
-                destination=file_path,
-                search=self.search_input.text().strip(),
-            )
-        except ValueError as exc:
-            QMessageBox.warning(self, "Export Failed", str(exc))
-            return
-
+        # The export runs off the UI thread; the button is disabled until
+        # the worker signals back so a second click cannot race the first.
+        self.report_button.setEnabled(False)
+        worker = _ReportExportWorker(month, file_path, self.search_input.text().strip())
+        self._report_signals = worker.signals
+        worker.signals.finished.connect(self._on_report_finished)
+        worker.signals.failed.connect(self._on_report_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_report_finished(self, report_path: str) -> None:
+        self.report_button.setEnabled(True)
         QMessageBox.information(self, "Report Exported", f"Saved report to:\n{report_path}")
+
+    def _on_report_failed(self, message: str) -> None:
+        self.report_button.setEnabled(True)
+        QMessageBox.warning(self, "Export Failed", message)
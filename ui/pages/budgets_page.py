@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections.abc import Callable
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -15,17 +15,17 @@ from PySide6.QtWidgets import (
     QLabel,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from services import FinanceService
+from ui.models import GREEN, RED, RIGHT_MID, Column, RowsModel, fmt_money
 
 
 class BudgetsPage(QWidget):
-    def __init__(self, service: FinanceService, on_data_changed: Callable[[], None], parent=None) -> None:
+    def __init__(self, service: FinanceService | None, on_data_changed: Callable[..., None], parent=None) -> None:
         super().__init__(parent)
         self.service = service
         self.on_data_changed = on_data_changed
@@ -47,6 +47,7 @@ class BudgetsPage(QWidget):
 
         self.category_input = QComboBox()
         self.category_input.setEditable(True)
+        self._category_items: tuple[str, ...] = ()
 
         self.planned_input = QDoubleSpinBox()
         self.planned_input.setRange(0.0, 1_000_000_000.0)
@@ -71,8 +72,23 @@ class BudgetsPage(QWidget):
         form_layout.addWidget(self.save_button, 2, 0, 1, 4)
         root.addWidget(form_card)
 
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels(["Category", "Planned", "Actual Spent", "Remaining", "Utilization"])
+        self.model = RowsModel(
+            (
+                Column("Category", lambda row: row["category"]),
+                Column("Planned", lambda row: fmt_money(row["planned"]), align=RIGHT_MID),
+                Column("Actual Spent", lambda row: fmt_money(row["actual"]), align=RIGHT_MID),
+                Column(
+                    "Remaining",
+                    lambda row: fmt_money(row["remaining"]),
+                    align=RIGHT_MID,
+                    foreground=lambda row: GREEN if row["remaining"] >= 0 else RED,
+                ),
+                Column("Utilization", lambda row: f"{row['utilization'] * 100:.1f}%", align=RIGHT_MID),
+            ),
+            self,
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionMode(QAbstractItemView.NoSelection)
@@ -88,7 +104,7 @@ class BudgetsPage(QWidget):
         self.current_month = month
         self.month_value.setText(month)
         self._refresh_categories()
-        self._refresh_table()
+        self.model.set_rows(self.service.get_budget_rows(month))
 
     def _on_save(self) -> None:
         category = self.category_input.currentText().strip()
@@ -99,44 +115,34 @@ class BudgetsPage(QWidget):
             QMessageBox.warning(self, "Unable to Save Budget", str(exc))
             return
 
-        self.on_data_changed()
-        self._refresh_table()
+        # Saving a budget only moves the planned side of one category, so
+        # patch that row in place instead of rebuilding the whole table.
+        rows = self.model.rows
+        row_index = next((i for i, row in enumerate(rows) if row["category"] == category), None)
+        actual = rows[row_index]["actual"] if row_index is not None else 0.0
+        new_row = {
+            "category": category,
+            "planned": planned,
+            "actual": actual,
+            "remaining": planned - actual,
+            "utilization": (actual / planned) if planned > 0 else 0.0,
+        }
+        if row_index is None:
+            self.model.insert_row(bisect_left([row["category"] for row in rows], category), new_row)
+        else:
+            self.model.update_row(row_index, new_row)
+        self.on_data_changed(skip_current=True)
 
     def _refresh_categories(self) -> None:
+        # Already deduped and sorted by SQLite; no Python set work needed.
+        items = tuple(self.service.get_category_union(self.current_month))
+        if items == self._category_items:
+            # Rebuilding an unchanged combo tears down its item model and
+            # completer state for nothing; most refreshes land here.
+            return
         current = self.category_input.currentText()
-        categories = set(self.service.get_categories())
-        categories.update(row["category"] for row in self.service.get_budget_rows(self.current_month))
         self.category_input.clear()
-        self.category_input.addItems(sorted(categories))
+        self.category_input.addItems(items)
         self.category_input.setCurrentText(current)
+        self._category_items = items
 
-    def _refresh_table(self) -> None:
-        rows = self.service.get_budget_rows(self.current_month)
-        self.table.setRowCount(len(rows))
-
-        for row_index, row in enumerate(rows):
-            self.table.setItem(row_index, 0, QTableWidgetItem(str(row["category"])))
-
-            planned_item = QTableWidgetItem(self._fmt_money(float(row["planned"])))
-            planned_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row_index, 1, planned_item)
-
-            actual_item = QTableWidgetItem(self._fmt_money(float(row["actual"])))
-            actual_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row_index, 2, actual_item)
-
-            remaining = float(row["remaining"])
-            remaining_item = QTableWidgetItem(self._fmt_money(remaining))
-            remaining_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            remaining_item.setForeground(QColor("#4ade80") if remaining >= 0 else QColor("#f87171"))
-            self.table.setItem(row_index, 3, remaining_item)
-
-            utilization = float(row["utilization"]) * 100
-            utilization_item = QTableWidgetItem(f"{utilization:.1f}%")
-            utilization_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row_index, 4, utilization_item)
-
-    @staticmethod
-    def _fmt_money(amount: float) -> str:
-        sign = "-" if amount < 0 else ""
-        return f"{sign}${abs(amount):,.2f}"
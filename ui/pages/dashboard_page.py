@@ -10,24 +10,69 @@ from PySide6.QtCharts import (
     QLineSeries,
     QValueAxis,
 )
-from PySide6.QtCore import QMargins, Qt
+from PySide6.QtCore import QMargins, QObject, QPointF, QRunnable, Qt, QThreadPool, Signal
 from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QFrame,
     QGridLayout,
     QHBoxLayout,
     QHeaderView,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QMessageBox,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from services import FinanceService
+from ui.models import BLUE, GREEN, RED, RIGHT_MID, Column, PagedRowsModel, RowsModel, fmt_money
 from ui.widgets import KpiCard
 
 
+class _QuerySignals(QObject):
+    finished = Signal(int, dict)
+    failed = Signal(str)
+
+
+class _DashboardQueryWorker(QRunnable):
+    """Runs the dashboard's read queries on a pool thread.
+
+    Like the report export worker, it builds a short-lived service around
+    fresh connections (sqlite3 connections are thread-bound) and hands the
+    query results back through a signal; the GUI thread only renders. The
+    generation number lets the page drop responses that a newer refresh has
+    already superseded.
+    """
+
+    def __init__(self, generation: int, month: str) -> None:
+        super().__init__()
+        self.signals = _QuerySignals()
+        self._generation = generation
+        self._month = month
+
+    def run(self) -> None:
+        from services.finance_service import open_worker_service
+
+        try:
+            service = open_worker_service()
+            try:
+                results = {
+                    "metrics": service.get_dashboard_metrics(self._month),
+                    "cashflow": service.get_cashflow_over_time(self._month, months=6),
+                    "expense": service.get_expense_breakdown(self._month),
+                    "networth": service.get_networth_over_time(self._month, months=6),
+                    "accounts": service.get_accounts(),
+                }
+            finally:
+                service.read_connection.close()
+                service.connection.close()
+        except Exception as exc:  # surfaced via signal; the thread has no UI
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(self._generation, results)
+
+
 class DashboardPage(QWidget):
     INCOME_COLOR = QColor("#34d399")
     EXPENSE_COLOR = QColor("#fb7185")
@@ -39,9 +84,11 @@ class DashboardPage(QWidget):
     AXIS_LINE_COLOR = QColor("#64748b")
     PLOT_BG = QColor(15, 23, 42, 160)
 
-    def __init__(self, service: FinanceService, parent=None) -> None:
+    def __init__(self, service: FinanceService | None, parent=None) -> None:
         super().__init__(parent)
         self.service = service
+        self._refresh_generation = 0
+        self._query_signals: _QuerySignals | None = None
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -67,6 +114,7 @@ class DashboardPage(QWidget):
             chart_view.setRenderHint(QPainter.Antialiasing)
             chart_view.setMinimumHeight(250)
             chart_view.setStyleSheet("background: transparent; border: none;")
+        self._init_charts()
 
         charts_grid = QGridLayout()
         charts_grid.setSpacing(12)
@@ -75,11 +123,27 @@ class DashboardPage(QWidget):
         charts_grid.addWidget(self._card_with_widget("Net Worth Over Time (6 Months)", self.networth_chart), 1, 0, 1, 2)
         root.addLayout(charts_grid)
 
-        self.recent_table = QTableWidget(0, 5)
-        self.recent_table.setHorizontalHeaderLabels(["Date", "Description", "Category", "Account", "Amount"])
+        self.recent_model = PagedRowsModel(
+            (
+                Column("Date", lambda tx: tx.date),
+                Column("Description", lambda tx: tx.description),
+                Column("Category", lambda tx: tx.category),
+                Column("Account", lambda tx: tx.account),
+                Column(
+                    "Amount",
+                    lambda tx: fmt_money(tx.amount),
+                    align=RIGHT_MID,
+                    foreground=lambda tx: RED if tx.amount < 0 else GREEN,
+                ),
+            ),
+            batch_size=25,
+            parent=self,
+        )
+        self.recent_table = QTableView()
+        self.recent_table.setModel(self.recent_model)
         self.recent_table.setAlternatingRowColors(True)
-        self.recent_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.recent_table.setSelectionMode(QTableWidget.NoSelection)
+        self.recent_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.recent_table.setSelectionMode(QAbstractItemView.NoSelection)
         self.recent_table.verticalHeader().setVisible(False)
         self.recent_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.recent_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
@@ -87,11 +151,26 @@ class DashboardPage(QWidget):
         self.recent_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
         self.recent_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
 
-        self.accounts_table = QTableWidget(0, 3)
-        self.accounts_table.setHorizontalHeaderLabels(["Name", "Kind", "Balance"])
+        self.accounts_model = RowsModel(
+            (
+                Column("Name", lambda account: account.name),
+                Column("Kind", lambda account: account.kind),
+                Column(
+                    "Balance",
+                    lambda account: fmt_money(account.balance),
+                    align=RIGHT_MID,
+                    foreground=lambda account: (
+                        RED if account.kind.strip().lower() in {"debt", "liability"} else BLUE
+                    ),
+                ),
+            ),
+            self,
+        )
+        self.accounts_table = QTableView()
+        self.accounts_table.setModel(self.accounts_model)
         self.accounts_table.setAlternatingRowColors(True)
-        self.accounts_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.accounts_table.setSelectionMode(QTableWidget.NoSelection)
+        self.accounts_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.accounts_table.setSelectionMode(QAbstractItemView.NoSelection)
         self.accounts_table.verticalHeader().setVisible(False)
         self.accounts_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.accounts_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -104,15 +183,31 @@ class DashboardPage(QWidget):
         root.addLayout(tables_row)
 
     def refresh(self, month: str, search: str = "") -> None:
-        metrics = self.service.get_dashboard_metrics(month)
-
+        # The heavy queries run on a pool thread and come back through
+        # _apply_results; the recent table keeps its on-demand paging, whose
+        # small LIMIT batches are cheap enough to stay on the GUI thread.
+        self._fill_recent_table(month, search)
+        self._refresh_generation += 1
+        worker = _DashboardQueryWorker(self._refresh_generation, month)
+        self._query_signals = worker.signals
+        worker.signals.finished.connect(self._apply_results)
+        worker.signals.failed.connect(self._on_query_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_results(self, generation: int, results: dict) -> None:
+        if generation != self._refresh_generation:
+            # A newer refresh was queued while this one ran; its results
+            # are on the way, so rendering these would just flicker.
+            return
+
+        metrics = results["metrics"]
         self.net_worth_card.set_values(
-            self._fmt_money(metrics["net_worth"]),
+            fmt_money(metrics["net_worth"]),
             f"Assets - Debts",
         )
         self.cashflow_card.set_values(
-            self._fmt_money(metrics["monthly_cashflow"]),
-            f"Income {self._fmt_money(metrics['income'])} | Expense {self._fmt_money(metrics['expense'])}",
+            fmt_money(metrics["monthly_cashflow"]),
+            f"Income {fmt_money(metrics['income'])} | Expense {fmt_money(metrics['expense'])}",
         )
         self.savings_card.set_values(
             f"{metrics['savings_rate'] * 100:.1f}%",
@@ -120,134 +215,122 @@ class DashboardPage(QWidget):
         )
         self.budget_card.set_values(
             f"{metrics['budget_pct'] * 100:.1f}% used",
-            f"Remaining {self._fmt_money(metrics['budget_remaining'])}",
+            f"Remaining {fmt_money(metrics['budget_remaining'])}",
         )
 
-        cashflow_data = self.service.get_cashflow_over_time(month, months=6)
-        expense_data = self.service.get_expense_breakdown(month)
-        networth_data = self.service.get_networth_over_time(month, months=6)
+        # Both time-series charts share the same month window, so the
+        # "MM/YY" labels are sliced out once here instead of per row.
+        months = {row["month"] for row in results["cashflow"]}
+        months.update(row["month"] for row in results["networth"])
+        labels = {month: f"{month[5:7]}/{month[2:4]}" for month in months}
 
-        self.cashflow_chart.setChart(self._build_cashflow_chart(cashflow_data))
-        self.expense_chart.setChart(self._build_expense_chart(expense_data))
-        self.networth_chart.setChart(self._build_networth_chart(networth_data))
+        self._update_cashflow_chart(results["cashflow"], labels)
+        self._update_expense_chart(results["expense"])
+        self._update_networth_chart(results["networth"], labels)
+        self.accounts_model.set_rows(results["accounts"])
 
-        self._fill_recent_table(month, search)
-        self._fill_accounts_table()
+    def _on_query_failed(self, message: str) -> None:
+        QMessageBox.warning(self, "Dashboard Refresh Failed", message)
 
     def _fill_recent_table(self, month: str, search: str) -> None:
-        rows = self.service.get_recent_transactions(month=month, search=search, limit=15)
-        self.recent_table.setRowCount(len(rows))
-        for row_index, tx in enumerate(rows):
-            self.recent_table.setItem(row_index, 0, QTableWidgetItem(tx.date))
-            self.recent_table.setItem(row_index, 1, QTableWidgetItem(tx.description))
-            self.recent_table.setItem(row_index, 2, QTableWidgetItem(tx.category))
-            self.recent_table.setItem(row_index, 3, QTableWidgetItem(tx.account))
-
-            amount_item = QTableWidgetItem(self._fmt_money(tx.amount))
-            amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            amount_item.setForeground(QColor("#f87171") if tx.amount < 0 else QColor("#4ade80"))
-            self.recent_table.setItem(row_index, 4, amount_item)
-
-    def _fill_accounts_table(self) -> None:
-        rows = self.service.get_accounts()
-        self.accounts_table.setRowCount(len(rows))
-        for row_index, account in enumerate(rows):
-            self.accounts_table.setItem(row_index, 0, QTableWidgetItem(account.name))
-            self.accounts_table.setItem(row_index, 1, QTableWidgetItem(account.kind))
-            balance_item = QTableWidgetItem(self._fmt_money(account.balance))
-            balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if account.kind.strip().lower() in {"debt", "liability"}:
-                balance_item.setForeground(QColor("#f87171"))
-            else:
-                balance_item.setForeground(QColor("#60a5fa"))
-            self.accounts_table.setItem(row_index, 2, balance_item)
-
-    def _build_cashflow_chart(self, rows: list[dict[str, float | str]]) -> QChart:
-        chart = self._base_chart("Cashflow")
-        categories = [self._month_label(str(row["month"])) for row in rows]
-
-        specs = [
+        # The view pulls pages on demand, so the refresh itself queries
+        # nothing; the first batch loads when the viewport asks for it.
+        service = self.service
+        self.recent_model.set_fetch(
+            lambda offset, limit: service.get_recent_transactions(
+                month=month, search=search, limit=limit, offset=offset
+            )
+        )
+
+    def _init_charts(self) -> None:
+        """Build the three charts once; refreshes only mutate their data.
+
+        Rebuilding a QChart per refresh allocated dozens of QObjects (axes,
+        series, pens, legend markers) and re-ran their setup every time;
+        mutating persistent series via replace() keeps all of that.
+        """
+        cashflow_chart = self._base_chart("Cashflow")
+        self._cashflow_series: dict[str, QLineSeries] = {}
+        for label, key, color in (
             ("Income", "income", self.INCOME_COLOR),
             ("Expense", "expense", self.EXPENSE_COLOR),
             ("Net", "net", self.NET_COLOR),
-        ]
-        for label, key, color in specs:
+        ):
             series = QLineSeries()
             series.setName(label)
             self._style_line_series(series, color, width=3)
-            for index, row in enumerate(rows):
-                series.append(float(index) + 0.5, float(row[key]))
-            chart.addSeries(series)
-
-        axis_x = self._line_axis(categories)
-        axis_y = QValueAxis()
-        axis_y.setLabelFormat("$%.0f")
-        axis_y.applyNiceNumbers()
-        self._style_axis(axis_x)
-        self._style_axis(axis_y)
-
-        chart.addAxis(axis_x, Qt.AlignBottom)
-        chart.addAxis(axis_y, Qt.AlignLeft)
-        for series in chart.series():
-            series.attachAxis(axis_x)
-            series.attachAxis(axis_y)
-        return chart
-
-    def _build_expense_chart(self, rows: list[dict[str, float | str]]) -> QChart:
-        chart = self._base_chart("Expense Breakdown")
-
-        categories = [str(row["category"]) for row in rows] or ["No Data"]
-        values = [float(row["spent"]) for row in rows] or [0.0]
-
-        bar_set = QBarSet("Spent")
-        for value in values:
-            bar_set.append(value)
-        bar_set.setColor(self.EXPENSE_COLOR)
-        bar_set.setBorderColor(QColor("#fecdd3"))
-
-        series = QBarSeries()
-        series.append(bar_set)
-        series.setBarWidth(0.62)
-        chart.addSeries(series)
-
-        axis_x = QBarCategoryAxis()
-        axis_x.append(categories)
-        axis_x.setLabelsAngle(-25)
-        axis_y = QValueAxis()
-        axis_y.setLabelFormat("$%.0f")
-        axis_y.applyNiceNumbers()
-        self._style_axis(axis_x)
-        self._style_axis(axis_y)
-
-        chart.addAxis(axis_x, Qt.AlignBottom)
-        chart.addAxis(axis_y, Qt.AlignLeft)
-        series.attachAxis(axis_x)
-        series.attachAxis(axis_y)
-        return chart
-
-    def _build_networth_chart(self, rows: list[dict[str, float | str]]) -> QChart:
-        chart = self._base_chart("Net Worth")
-        categories = [self._month_label(str(row["month"])) for row in rows]
-
-        series = QLineSeries()
-        series.setName("Net Worth")
-        self._style_line_series(series, self.NETWORTH_COLOR, width=3)
-        for index, row in enumerate(rows):
-            series.append(float(index) + 0.5, float(row["value"]))
-        chart.addSeries(series)
-
-        axis_x = self._line_axis(categories)
-        axis_y = QValueAxis()
-        axis_y.setLabelFormat("$%.0f")
-        axis_y.applyNiceNumbers()
-        self._style_axis(axis_x)
-        self._style_axis(axis_y)
-
-        chart.addAxis(axis_x, Qt.AlignBottom)
-        chart.addAxis(axis_y, Qt.AlignLeft)
-        series.attachAxis(axis_x)
-        series.attachAxis(axis_y)
-        return chart
+            cashflow_chart.addSeries(series)
+            self._cashflow_series[key] = series
+        self._cashflow_axis_x = self._line_axis()
+        self._cashflow_axis_y = self._money_axis()
+        self._attach_axes(cashflow_chart, self._cashflow_axis_x, self._cashflow_axis_y)
+        self._cashflow_categories: tuple[str, ...] = ()
+        self.cashflow_chart.setChart(cashflow_chart)
+
+        expense_chart = self._base_chart("Expense Breakdown")
+        self._expense_set = QBarSet("Spent")
+        self._expense_set.setColor(self.EXPENSE_COLOR)
+        self._expense_set.setBorderColor(QColor("#fecdd3"))
+        bar_series = QBarSeries()
+        bar_series.append(self._expense_set)
+        bar_series.setBarWidth(0.62)
+        expense_chart.addSeries(bar_series)
+        self._expense_axis_x = QBarCategoryAxis()
+        self._expense_axis_x.setLabelsAngle(-25)
+        self._expense_axis_y = self._money_axis()
+        self._attach_axes(expense_chart, self._expense_axis_x, self._expense_axis_y)
+        self._expense_categories: tuple[str, ...] = ()
+        self.expense_chart.setChart(expense_chart)
+
+        networth_chart = self._base_chart("Net Worth")
+        self._networth_series = QLineSeries()
+        self._networth_series.setName("Net Worth")
+        self._style_line_series(self._networth_series, self.NETWORTH_COLOR, width=3)
+        networth_chart.addSeries(self._networth_series)
+        self._networth_axis_x = self._line_axis()
+        self._networth_axis_y = self._money_axis()
+        self._attach_axes(networth_chart, self._networth_axis_x, self._networth_axis_y)
+        self._networth_categories: tuple[str, ...] = ()
+        self.networth_chart.setChart(networth_chart)
+
+    def _update_cashflow_chart(self, rows: list[dict[str, float | str]], labels: dict[str, str]) -> None:
+        self._set_animation_for_size(self.cashflow_chart.chart(), len(rows))
+        categories = tuple(labels[row["month"]] for row in rows)
+        if categories != self._cashflow_categories:
+            self._replace_line_categories(self._cashflow_axis_x, categories)
+            self._cashflow_categories = categories
+
+        values: list[float] = []
+        for key, series in self._cashflow_series.items():
+            # One replace() call hands the whole point list across the
+            # binding instead of a Python->Qt hop per data point.
+            series.replace([QPointF(index + 0.5, row[key]) for index, row in enumerate(rows)])
+            values.extend(row[key] for row in rows)
+        self._rescale_money_axis(self._cashflow_axis_y, values)
+
+    def _update_expense_chart(self, rows: list[dict[str, float | str]]) -> None:
+        self._set_animation_for_size(self.expense_chart.chart(), len(rows))
+        categories = tuple(row["category"] for row in rows) or ("No Data",)
+        values = [row["spent"] for row in rows] or [0.0]
+
+        if categories != self._expense_categories:
+            self._expense_axis_x.clear()
+            self._expense_axis_x.append(list(categories))
+            self._expense_categories = categories
+        self._expense_set.remove(0, self._expense_set.count())
+        self._expense_set.append(values)
+        self._rescale_money_axis(self._expense_axis_y, values)
+
+    def _update_networth_chart(self, rows: list[dict[str, float | str]], labels: dict[str, str]) -> None:
+        self._set_animation_for_size(self.networth_chart.chart(), len(rows))
+        categories = tuple(labels[row["month"]] for row in rows)
+        if categories != self._networth_categories:
+            self._replace_line_categories(self._networth_axis_x, categories)
+            self._networth_categories = categories
+
+        values = [row["value"] for row in rows]
+        self._networth_series.replace([QPointF(index + 0.5, value) for index, value in enumerate(values)])
+        self._rescale_money_axis(self._networth_axis_y, values)
 
     def _base_chart(self, _title: str) -> QChart:
         chart = QChart()
@@ -275,17 +358,56 @@ class DashboardPage(QWidget):
             axis.setMinorGridLineVisible(True)
             axis.setMinorGridLineColor(self.MINOR_GRID_COLOR)
 
-    @staticmethod
-    def _line_axis(categories: list[str]) -> QCategoryAxis:
-        labels = categories if categories else ["No Data"]
+    def _line_axis(self) -> QCategoryAxis:
         axis = QCategoryAxis()
-        for index, label in enumerate(labels, start=1):
-            axis.append(label, float(index))
         axis.setStartValue(0.0)
-        axis.setRange(0.0, float(max(len(labels), 1)))
         axis.setLabelsAngle(-18)
         return axis
 
+    def _money_axis(self) -> QValueAxis:
+        axis = QValueAxis()
+        axis.setLabelFormat("$%.0f")
+        return axis
+
+    def _attach_axes(self, chart: QChart, axis_x, axis_y: QValueAxis) -> None:
+        self._style_axis(axis_x)
+        self._style_axis(axis_y)
+        chart.addAxis(axis_x, Qt.AlignBottom)
+        chart.addAxis(axis_y, Qt.AlignLeft)
+        for series in chart.series():
+            series.attachAxis(axis_x)
+            series.attachAxis(axis_y)
+
+    @staticmethod
+    def _replace_line_categories(axis: QCategoryAxis, categories: tuple[str, ...]) -> None:
+        # QCategoryAxis has no clear(); drop the old labels one by one.
+        for label in axis.categoriesLabels():
+            axis.remove(label)
+        labels = list(categories) or ["No Data"]
+        for index, label in enumerate(labels, start=1):
+            axis.append(label, float(index))
+        axis.setRange(0.0, float(len(labels)))
+
+    @staticmethod
+    def _set_animation_for_size(chart: QChart, count: int) -> None:
+        # Series animations recompute layout per frame for ~450 ms; fine for
+        # a handful of points, a stall for dense data, so large updates land
+        # instantly instead.
+        options = QChart.NoAnimation if count > 24 else QChart.SeriesAnimations
+        if chart.animationOptions() != options:
+            chart.setAnimationOptions(options)
+
+    @staticmethod
+    def _rescale_money_axis(axis: QValueAxis, values: list[float]) -> None:
+        # Persistent axes do not track series data, so the range is set
+        # explicitly from the new values before rounding it to nice numbers.
+        low = min(min(values, default=0.0), 0.0)
+        high = max(values, default=0.0)
+        if high <= low:
+            high = low + 1.0
+        axis.setRange(low, high)
+        axis.applyNiceNumbers()
+
     @staticmethod
     def _style_line_series(series: QLineSeries, color: QColor, width: int) -> None:
         pen = QPen(color)
@@ -308,12 +430,3 @@ class DashboardPage(QWidget):
         layout.addWidget(inner)
         return card
 
-    @staticmethod
-    def _month_label(month_key: str) -> str:
-        year, month = month_key.split("-")
-        return f"{month}/{year[2:]}"
-
-    @staticmethod
-    def _fmt_money(amount: float) -> str:
-        sign = "-" if amount < 0 else ""
-        return f"{sign}${abs(amount):,.2f}"
@@ -3,7 +3,6 @@ from __future__ import annotations
 from collections.abc import Callable
 
 from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QCheckBox,
@@ -16,22 +15,26 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QDoubleSpinBox,
 )
 
+from models import Goal
 from services import FinanceService
+from ui.models import AMBER, BLUE, GREEN, RIGHT_MID, Column, RowsModel, fmt_money
 
 
 class GoalsPage(QWidget):
-    def __init__(self, service: FinanceService, on_data_changed: Callable[[], None], parent=None) -> None:
+    def __init__(self, service: FinanceService | None, on_data_changed: Callable[..., None], parent=None) -> None:
         super().__init__(parent)
         self.service = service
         self.on_data_changed = on_data_changed
         self.selected_goal_id: int | None = None
+        # Set while the table is repopulated programmatically, so the
+        # selection-clear from a model reset cannot clobber the edit form.
+        self._updating = False
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -114,8 +117,30 @@ class GoalsPage(QWidget):
         form_layout.addLayout(actions, 2, 2, 1, 2)
         root.addWidget(form_card)
 
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Current", "Target", "Progress", "Remaining", "Deadline"])
+        self.model = RowsModel(
+            (
+                Column("ID", lambda goal: str(goal.id)),
+                Column("Name", lambda goal: goal.name),
+                Column("Current", lambda goal: fmt_money(goal.current), align=RIGHT_MID),
+                Column("Target", lambda goal: fmt_money(goal.target), align=RIGHT_MID),
+                Column(
+                    "Progress",
+                    lambda goal: f"{self._progress(goal) * 100:.1f}%",
+                    align=RIGHT_MID,
+                    foreground=lambda goal: GREEN if self._progress(goal) >= 1 else BLUE,
+                ),
+                Column(
+                    "Remaining",
+                    lambda goal: fmt_money(goal.target - goal.current),
+                    align=RIGHT_MID,
+                    foreground=lambda goal: GREEN if goal.target - goal.current <= 0 else AMBER,
+                ),
+                Column("Deadline", lambda goal: goal.deadline or "None"),
+            ),
+            self,
+        )
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -129,7 +154,7 @@ class GoalsPage(QWidget):
         self.table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeToContents)
         self.table.setColumnHidden(0, True)
-        self.table.itemSelectionChanged.connect(self._load_selected_from_table)
+        self.table.selectionModel().selectionChanged.connect(self._load_selected_from_table)
 
         root.addWidget(self.table)
         self._on_clear()
@@ -140,66 +165,54 @@ class GoalsPage(QWidget):
 
     def _refresh_summary(self) -> None:
         summary = self.service.get_goals_summary()
-        self.total_current_label.setText(self._fmt_money(summary["total_current"]))
-        self.total_target_label.setText(self._fmt_money(summary["total_target"]))
-        self.remaining_label.setText(self._fmt_money(summary["remaining"]))
+        self.total_current_label.setText(fmt_money(summary["total_current"]))
+        self.total_target_label.setText(fmt_money(summary["total_target"]))
+        self.remaining_label.setText(fmt_money(summary["remaining"]))
         self.progress_label.setText(f"{summary['progress'] * 100:.1f}%")
         self.progress_label.setStyleSheet(
             f"font-size: 18px; font-weight: 700; color: {'#4ade80' if summary['progress'] >= 1 else '#60a5fa'};"
         )
 
     def _refresh_table(self) -> None:
-        goals = self.service.get_goals()
-        self.table.setRowCount(len(goals))
-        for row_index, goal in enumerate(goals):
-            progress_ratio = (goal.current / goal.target) if goal.target > 0 else 0.0
-            remaining = goal.target - goal.current
-            deadline_text = goal.deadline or "None"
-
-            self.table.setItem(row_index, 0, QTableWidgetItem(str(goal.id)))
-            self.table.setItem(row_index, 1, QTableWidgetItem(goal.name))
-
-            current_item = QTableWidgetItem(self._fmt_money(goal.current))
-            current_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row_index, 2, current_item)
-
-            target_item = QTableWidgetItem(self._fmt_money(goal.target))
-            target_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(row_index, 3, target_item)
-
-            progress_item = QTableWidgetItem(f"{progress_ratio * 100:.1f}%")
-            progress_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            progress_item.setForeground(QColor("#4ade80") if progress_ratio >= 1 else QColor("#60a5fa"))
-            self.table.setItem(row_index, 4, progress_item)
-
-            remaining_item = QTableWidgetItem(self._fmt_money(remaining))
-            remaining_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            remaining_item.setForeground(QColor("#4ade80") if remaining <= 0 else QColor("#f59e0b"))
-            self.table.setItem(row_index, 5, remaining_item)
-
-            self.table.setItem(row_index, 6, QTableWidgetItem(deadline_text))
+        self._updating = True
+        try:
+            self.model.set_rows(self.service.get_goals())
+            # Re-select the goal that was being edited; the guard keeps the
+            # reselect from re-reading the row into the half-edited form.
+            row_index = self._row_index_of(self.selected_goal_id)
+            if row_index is not None:
+                self.table.selectRow(row_index)
+        finally:
+            self._updating = False
+        if self.selected_goal_id is not None and row_index is None:
+            # The selected goal disappeared (e.g. restored backup).
+            self._on_clear()
 
     def _load_selected_from_table(self) -> None:
-        row = self.table.currentRow()
-        if row < 0:
+        if self._updating:
+            return
+        selected = self.table.selectionModel().selectedRows()
+        if not selected:
             self.selected_goal_id = None
             self.save_button.setText("Add Goal")
             self.delete_button.setEnabled(False)
             return
 
-        self.selected_goal_id = int(self.table.item(row, 0).text())
+        # The model keeps the Goal dataclasses, so the form reads raw values
+        # directly instead of parsing formatted cell text back into floats.
+        goal = self.model.row_at(selected[0].row())
+        self.selected_goal_id = goal.id
         self.save_button.setText("Update Goal")
         self.delete_button.setEnabled(True)
 
-        self.name_input.setText(self.table.item(row, 1).text())
-        self.current_input.setValue(abs(self._parse_money(self.table.item(row, 2).text())))
-        self.target_input.setValue(abs(self._parse_money(self.table.item(row, 3).text())))
+        self.name_input.setText(goal.name)
+        self.current_input.setValue(abs(goal.current))
+        self.target_input.setValue(abs(goal.target))
 
-        deadline_text = self.table.item(row, 6).text()
-        if deadline_text == "None":
+        if not goal.deadline:
             self.no_deadline_checkbox.setChecked(True)
         else:
-            deadline = QDate.fromString(deadline_text, "yyyy-MM-dd")
+            deadline = QDate.fromString(goal.deadline, "yyyy-MM-dd")
             self.no_deadline_checkbox.setChecked(False)
             if deadline.isValid():
                 self.deadline_input.setDate(deadline)
@@ -212,25 +225,50 @@ class GoalsPage(QWidget):
             "deadline": None if self.no_deadline_checkbox.isChecked() else self.deadline_input.date().toString("yyyy-MM-dd"),
         }
 
+        goal_id = self.selected_goal_id
         try:
-            if self.selected_goal_id is None:
-                self.service.add_goal(**payload)
+            if goal_id is None:
+                goal_id = self.service.add_goal(**payload)
             else:
-                self.service.update_goal(goal_id=self.selected_goal_id, **payload)
+                self.service.update_goal(goal_id=goal_id, **payload)
         except ValueError as exc:
             QMessageBox.warning(self, "Unable to Save Goal", str(exc))
             return
 
+        # Mirror the service's normalization so the patched row matches what
+        # a full re-query would show.
+        goal = Goal(
+            id=goal_id,
+            name=payload["name"].strip(),
+            target=float(payload["target"]),
+            current=float(payload["current"]),
+            deadline=payload["deadline"],
+        )
+        row_index = self._row_index_of(goal_id)
+        if self.selected_goal_id is None:
+            # list_all orders by id descending, so a new goal lands on top.
+            self.model.insert_row(0, goal)
+        elif row_index is not None:
+            self.model.update_row(row_index, goal)
+
         self._on_clear()
-        self.on_data_changed()
+        self._refresh_summary()
+        self.on_data_changed(skip_current=True)
 
     def _on_delete(self) -> None:
         if self.selected_goal_id is None:
             QMessageBox.information(self, "No Selection", "Select a goal first.")
             return
         self.service.delete_goal(self.selected_goal_id)
+        row_index = self._row_index_of(self.selected_goal_id)
+        if row_index is not None:
+            self.model.remove_row(row_index)
         self._on_clear()
-        self.on_data_changed()
+        self._refresh_summary()
+        self.on_data_changed(skip_current=True)
+
+    def _row_index_of(self, goal_id: int | None) -> int | None:
+        return next((i for i, goal in enumerate(self.model.rows) if goal.id == goal_id), None)
 
     def _on_clear(self) -> None:
         self.selected_goal_id = None
@@ -256,10 +294,6 @@ class GoalsPage(QWidget):
         return frame
 
     @staticmethod
-    def _parse_money(raw: str) -> float:
-        return float(raw.replace("$", "").replace(",", ""))
+    def _progress(goal) -> float:
+        return (goal.current / goal.target) if goal.target > 0 else 0.0
 
-    @staticmethod
-    def _fmt_money(amount: float) -> str:
-        sign = "-" if amount < 0 else ""
-        return f"{sign}${abs(amount):,.2f}"
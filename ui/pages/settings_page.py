@@ -5,6 +5,7 @@ from datetime import datetime
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
+    QApplication,
     QFileDialog,
     QFrame,
     QHBoxLayout,
@@ -19,7 +20,7 @@ from services import FinanceService
 
 
 class SettingsPage(QWidget):
-    def __init__(self, service: FinanceService, on_data_changed: Callable[[], None], parent=None) -> None:
+    def __init__(self, service: FinanceService | None, on_data_changed: Callable[[], None], parent=None) -> None:
         super().__init__(parent)
         self.service = service
         self.on_data_changed = on_data_changed
@@ -32,7 +33,10 @@ class SettingsPage(QWidget):
         title.setStyleSheet("font-size: 20px; font-weight: 700;")
         root.addWidget(title)
 
+        # One rich-text label per card instead of a heading label plus a
+        # body label: fewer widgets in the paint tree for the same layout.
         self.path_label = QLabel("")
+        self.path_label.setTextFormat(Qt.RichText)
         self.path_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
         db_card = QFrame()
@@ -40,7 +44,6 @@ class SettingsPage(QWidget):
         db_layout = QVBoxLayout(db_card)
         db_layout.setContentsMargins(12, 12, 12, 12)
         db_layout.setSpacing(8)
-        db_layout.addWidget(QLabel("Database File"))
         db_layout.addWidget(self.path_label)
         root.addWidget(db_card)
 
@@ -49,7 +52,6 @@ class SettingsPage(QWidget):
         backup_layout = QVBoxLayout(backup_card)
         backup_layout.setContentsMargins(12, 12, 12, 12)
         backup_layout.setSpacing(8)
-        backup_layout.addWidget(QLabel("Backup and Restore"))
 
         actions = QHBoxLayout()
         actions.setSpacing(8)
@@ -61,18 +63,29 @@ class SettingsPage(QWidget):
         actions.addWidget(self.restore_button)
         actions.addStretch()
 
-        self.status_label = QLabel("No backup actions yet.")
-        self.status_label.setStyleSheet("color: #94a3b8;")
+        self.status_label = QLabel("")
+        self.status_label.setTextFormat(Qt.RichText)
+        self._set_status("No backup actions yet.")
 
-        backup_layout.addLayout(actions)
         backup_layout.addWidget(self.status_label)
+        backup_layout.addLayout(actions)
         root.addWidget(backup_card)
         root.addStretch()
 
         self.refresh()
 
+    @staticmethod
+    def _pump_events(_status: int, _remaining: int, _total: int) -> None:
+        """Keep the UI responsive between incremental backup steps."""
+        QApplication.processEvents()
+
+    def _set_status(self, text: str) -> None:
+        self.status_label.setText(f"<b>Backup and Restore</b><br><span style='color: #94a3b8;'>{text}</span>")
+
     def refresh(self) -> None:
-        self.path_label.setText(str(self.service.get_database_path()))
+        if self.service is None:
+            return
+        self.path_label.setText(f"<b>Database File</b><br>{self.service.get_database_path()}")
 
     def _on_backup(self) -> None:
         default_name = f"finance-backup-{datetime.now():%Y%m%d-%H%M%S}.db"
@@ -80,13 +93,21 @@ class SettingsPage(QWidget):
         if not selected:
             return
 
+        # _pump_events makes this handler re-entrant, so keep both buttons
+        # disabled until the copy finishes — a second click must not start a
+        # nested backup/restore on the same connection mid-copy.
+        self.backup_button.setEnabled(False)
+        self.restore_button.setEnabled(False)
         try:
-            backup_path = self.service.backup_database(selected)
+            backup_path = self.service.backup_database(selected, progress=self._pump_events)
         except Exception as exc:  # pragma: no cover - UI error handling path
             QMessageBox.warning(self, "Backup Failed", str(exc))
             return
+        finally:
+            self.backup_button.setEnabled(True)
+            self.restore_button.setEnabled(True)
 
-        self.status_label.setText(f"Backup created: {backup_path}")
+        self._set_status(f"Backup created: {backup_path}")
         QMessageBox.information(self, "Backup Complete", f"Backup saved to:\n{backup_path}")
 
     def _on_restore(self) -> None:
@@ -102,12 +123,17 @@ class SettingsPage(QWidget):
         if answer != QMessageBox.Yes:
             return
 
+        self.backup_button.setEnabled(False)
+        self.restore_button.setEnabled(False)
         try:
-            self.service.restore_database(selected)
+            self.service.restore_database(selected, progress=self._pump_events)
         except Exception as exc:  # pragma: no cover - UI error handling path
             QMessageBox.warning(self, "Restore Failed", str(exc))
             return
+        finally:
+            self.backup_button.setEnabled(True)
+            self.restore_button.setEnabled(True)
 
-        self.status_label.setText(f"Database restored from: {selected}")
+        self._set_status(f"Database restored from: {selected}")
         self.on_data_changed()
         QMessageBox.information(self, "Restore Complete", "Database restore completed.")
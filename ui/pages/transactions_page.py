@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 
-from PySide6.QtCore import QDate, Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import QDate
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
@@ -17,17 +17,24 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from services import FinanceService
+from ui.models import GREEN, RED, RIGHT_MID, Column, PagedRowsModel, fmt_money
+
+
+@lru_cache(maxsize=512)
+def _parse_date(date_text: str) -> QDate:
+    # Rows cluster on a handful of dates per month, so rapid keyboard
+    # navigation mostly re-selects dates this has already parsed.
+    return QDate.fromString(date_text, "yyyy-MM-dd")
 
 
 class TransactionsPage(QWidget):
-    def __init__(self, service: FinanceService, on_data_changed: Callable[[], None], parent=None) -> None:
+    def __init__(self, service: FinanceService | None, on_data_changed: Callable[[], None], parent=None) -> None:
         super().__init__(parent)
         self.service = service
         self.on_data_changed = on_data_changed
@@ -56,9 +63,11 @@ class TransactionsPage(QWidget):
 
         self.category_input = QComboBox()
         self.category_input.setEditable(True)
+        self._category_items: tuple[str, ...] = ()
 
         self.account_input = QComboBox()
         self.account_input.setEditable(True)
+        self._account_items: tuple[str, ...] = ()
 
         self.type_input = QComboBox()
         self.type_input.addItems(["income", "expense"])
@@ -102,24 +111,41 @@ class TransactionsPage(QWidget):
         form_layout.addLayout(buttons_row, 3, 0, 1, 4)
         root.addWidget(form_card)
 
-        self.table = QTableWidget(0, 7)
-        self.table.setHorizontalHeaderLabels(
-            ["ID", "Date", "Description", "Category", "Account", "Type", "Amount"]
+        self.model = PagedRowsModel(
+            (
+                Column("ID", lambda tx: str(tx.id)),
+                Column("Date", lambda tx: tx.date),
+                Column("Description", lambda tx: tx.description),
+                Column("Category", lambda tx: tx.category),
+                Column("Account", lambda tx: tx.account),
+                Column("Type", lambda tx: tx.type),
+                Column(
+                    "Amount",
+                    lambda tx: fmt_money(tx.amount),
+                    align=RIGHT_MID,
+                    foreground=lambda tx: RED if tx.amount < 0 else GREEN,
+                ),
+            ),
+            batch_size=200,
+            parent=self,
         )
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setAlternatingRowColors(True)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.verticalHeader().setVisible(False)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeToContents)
+        # ResizeToContents re-measures every loaded cell whenever a page of
+        # rows arrives; fixed user-adjustable widths keep header layout off
+        # the scroll path. Description absorbs the leftover width.
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        for column, width in ((1, 100), (3, 130), (4, 130), (5, 85), (6, 110)):
+            header.resizeSection(column, width)
         self.table.setColumnHidden(0, True)
-        self.table.itemSelectionChanged.connect(self._load_selected_from_table)
+        self.table.selectionModel().selectionChanged.connect(self._load_selected_from_table)
 
         root.addWidget(self.table)
 
@@ -130,61 +156,57 @@ class TransactionsPage(QWidget):
         self._refresh_table()
 
     def _refresh_combos(self) -> None:
-        category_text = self.category_input.currentText()
-        account_text = self.account_input.currentText()
-
-        categories = self.service.get_categories()
-        accounts = self.service.get_account_names()
-
-        self.category_input.clear()
-        self.category_input.addItems(categories)
-        self.category_input.setCurrentText(category_text)
-
-        self.account_input.clear()
-        self.account_input.addItems(accounts)
-        self.account_input.setCurrentText(account_text)
+        # Rebuilding an unchanged combo resets its item model and completer
+        # state for nothing; most refreshes leave both lists identical.
+        categories = tuple(self.service.get_categories())
+        if categories != self._category_items:
+            category_text = self.category_input.currentText()
+            self.category_input.clear()
+            self.category_input.addItems(categories)
+            self.category_input.setCurrentText(category_text)
+            self._category_items = categories
+
+        accounts = tuple(self.service.get_account_names())
+        if accounts != self._account_items:
+            account_text = self.account_input.currentText()
+            self.account_input.clear()
+            self.account_input.addItems(accounts)
+            self.account_input.setCurrentText(account_text)
+            self._account_items = accounts
 
     def _refresh_table(self) -> None:
-        rows = self.service.get_transactions(self.current_month, self.current_search)
-        self.table.setRowCount(len(rows))
-
-        for row_index, tx in enumerate(rows):
-            self.table.setItem(row_index, 0, QTableWidgetItem(str(tx.id)))
-            self.table.setItem(row_index, 1, QTableWidgetItem(tx.date))
-            self.table.setItem(row_index, 2, QTableWidgetItem(tx.description))
-            self.table.setItem(row_index, 3, QTableWidgetItem(tx.category))
-            self.table.setItem(row_index, 4, QTableWidgetItem(tx.account))
-            self.table.setItem(row_index, 5, QTableWidgetItem(tx.type))
-
-            amount_item = QTableWidgetItem(self._fmt_money(tx.amount))
-            amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            amount_item.setData(Qt.UserRole, tx.amount)
-            amount_item.setForeground(QColor("#f87171") if tx.amount < 0 else QColor("#4ade80"))
-            self.table.setItem(row_index, 6, amount_item)
+        # The view pulls 200-row pages on demand, so a month switch only
+        # pays for what scrolls into the viewport, not the whole history.
+        service = self.service
+        month = self.current_month
+        search = self.current_search
+        self.model.set_fetch(
+            lambda offset, limit: service.get_transactions(month, search, limit=limit, offset=offset)
+        )
 
     def _load_selected_from_table(self) -> None:
-        row = self.table.currentRow()
-        if row < 0:
+        selected = self.table.selectionModel().selectedRows()
+        if not selected:
             self.selected_transaction_id = None
             self.save_button.setText("Add Transaction")
             self.delete_button.setEnabled(False)
             return
 
-        tx_id_text = self.table.item(row, 0).text()
-        self.selected_transaction_id = int(tx_id_text)
+        # The model keeps the Transaction dataclasses, so the form reads raw
+        # values directly instead of parsing formatted cell text.
+        tx = self.model.row_at(selected[0].row())
+        self.selected_transaction_id = tx.id
         self.delete_button.setEnabled(True)
         self.save_button.setText("Update Transaction")
 
-        date_text = self.table.item(row, 1).text()
-        date_value = QDate.fromString(date_text, "yyyy-MM-dd")
+        date_value = _parse_date(tx.date)
         if date_value.isValid():
             self.date_input.setDate(date_value)
-        self.description_input.setText(self.table.item(row, 2).text())
-        self.category_input.setCurrentText(self.table.item(row, 3).text())
-        self.account_input.setCurrentText(self.table.item(row, 4).text())
-        self.type_input.setCurrentText(self.table.item(row, 5).text())
-        amount = float(self.table.item(row, 6).data(Qt.UserRole))
-        self.amount_input.setValue(abs(amount))
+        self.description_input.setText(tx.description)
+        self.category_input.setCurrentText(tx.category)
+        self.account_input.setCurrentText(tx.account)
+        self.type_input.setCurrentText(tx.type)
+        self.amount_input.setValue(abs(tx.amount))
 
     def _on_save(self) -> None:
         if self.amount_input.value() <= 0:
@@ -230,8 +252,3 @@ class TransactionsPage(QWidget):
         self.amount_input.setValue(50.0)
         self.save_button.setText("Add Transaction")
         self.delete_button.setEnabled(False)
-
-    @staticmethod
-    def _fmt_money(amount: float) -> str:
-        sign = "-" if amount < 0 else ""
-        return f"{sign}${abs(amount):,.2f}"
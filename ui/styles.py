@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 from PySide6.QtWidgets import QApplication
 
 
@@ -185,7 +187,7 @@ QPushButton#ToolbarButton:hover {
     background-color: rgba(37, 99, 235, 0.28);
 }
 
-QTableWidget {
+QTableView {
     background-color: rgba(15, 23, 42, 0.82);
     alternate-background-color: rgba(17, 24, 39, 0.9);
     gridline-color: #253044;
@@ -260,5 +262,16 @@ QToolTip {
 """
 
 
+# Qt re-parses the whole sheet on every setStyleSheet call, so the source
+# above stays readable while the parser gets a whitespace-collapsed copy,
+# and repeat applications are short-circuited outright.
+_MINIFIED_STYLESHEET = re.sub(r"\s+", " ", DARK_STYLESHEET).strip()
+_applied = False
+
+
 def apply_dark_theme(app: QApplication) -> None:
-    app.setStyleSheet(DARK_STYLESHEET)
+    global _applied
+    if _applied:
+        return
+    app.setStyleSheet(_MINIFIED_STYLESHEET)
+    _applied = True